@@ -1,5 +1,10 @@
 from abc import ABCMeta
 from abc import abstractmethod
+import math
+
+import numpy as np
+
+from utils import image
 
 
 class AbstractDetector(object):
@@ -9,6 +14,24 @@ class AbstractDetector(object):
 
     __metaclass__ = ABCMeta
 
+    # Macedonian car plate size: 52x11 cm, aspect ratio = 4,72727272727
+    plate_aspect = float(52) / float(11)
+
+    # TODO: Adjust error rate
+    aspect_error_min = 0.17
+    aspect_error_max = 0.32
+
+    # TODO: Adjust coefficients for min and max area
+    min_area = 15 * plate_aspect * 15
+    max_area = 112 * plate_aspect * 112
+
+    # Set aspect ratios with account to error.
+    min_ratio = plate_aspect - plate_aspect * aspect_error_min
+    max_ratio = plate_aspect + plate_aspect * aspect_error_max
+
+    # Shortest long side of a candidate passing the size check
+    min_plate_width = math.sqrt(min_area * min_ratio)
+
     @abstractmethod
     def find_plates(self):
         """
@@ -20,7 +43,68 @@ class AbstractDetector(object):
         """
         pass
 
-    @abstractmethod
+    def find_rectangles(self):
+        """
+        Find the locations of the license plates in the image, without cropping and zooming the plates
+
+        Detectors should override this with the detection part of find_plates. The default crops the plates anyway
+
+        :rtype: list[numpy.array]
+        :return: List of the plate rectangle locations
+        """
+
+        return [rectangle for plate, rectangle in self.find_plates()]
+
+    def set_area_limits(self, min_area, max_area):
+        """
+        Set the plate area limits of this detector, for an image whose plates are bigger or smaller than usual.
+        The aspect ratio limits stay the same
+
+        :type min_area: float
+        :param min_area: Area of the smallest plate
+        :type max_area: float
+        :param max_area: Area of the biggest plate
+        """
+
+        self.min_area = min_area
+        self.max_area = max_area
+        self.min_plate_width = math.sqrt(min_area * self.min_ratio)
+
+    def _check_sizes(self, candidates, areas=None):
+        """
+        Check size of every candidate with respect to aspect ratio of a standard license plate
+
+        :type candidates: list[numpy.array] | numpy.array
+        :param candidates: Rectangles of four points, either (4, 2) or (4, 1, 2) arrays, or a single (N, 4, 2) array
+        :type areas: list[float] | numpy.array | None
+        :param areas: Optional areas to check instead of width * height of the candidates
+        :rtype: numpy.array
+        :return: Boolean array, True for every candidate satisfying the conditions
+        """
+
+        if len(candidates) == 0:
+            return np.zeros(0, np.bool_)
+
+        candidate_width, candidate_height = image.calculate_sizes(
+            np.array([np.reshape(candidate, (4, 2)) for candidate in candidates]))
+        valid = np.logical_and(candidate_width != 0.0, candidate_height != 0.0)
+
+        # Calculate candidate areas, skipping the division for empty candidates
+        candidate_area = candidate_height * candidate_width if areas is None else np.asarray(areas, np.float64)
+        candidate_ratio = candidate_width / np.where(valid, candidate_height, 1.0)
+        candidate_ratio = np.where(candidate_ratio < 1, 1 / np.where(valid, candidate_ratio, 1.0), candidate_ratio)
+
+        passed = valid & (self.min_area <= candidate_area) & (candidate_area <= self.max_area) & \
+            (self.min_ratio <= candidate_ratio) & (candidate_ratio <= self.max_ratio)
+
+        if __debug__:
+            for i in np.flatnonzero(passed):
+                print("Candidate width: %.3f, height: %.3f" % (candidate_width[i], candidate_height[i]))
+                print("Candidate area: %f" % candidate_area[i])
+                print("Candidate ratio: %f" % candidate_ratio[i])
+                print("Passed\n")
+        return passed
+
     def _check_size(self, candidate, area=None):
         """
         Perform size check on the specified rectangle
@@ -31,4 +115,5 @@ class AbstractDetector(object):
         :rtype: bool
         :return: True if conditions satisfied, otherwise False
         """
-        pass
+
+        return bool(self._check_sizes([candidate], None if area is None else [area])[0])
\ No newline at end of file
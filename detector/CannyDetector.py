@@ -2,6 +2,7 @@ import cv2
 
 from detector import AbstractDetector
 from utils import loader, display, image
+from utils.preprocess import PreprocessingContext
 
 
 class CannyDetector(AbstractDetector):
@@ -9,7 +10,7 @@ class CannyDetector(AbstractDetector):
     Detector that uses canny edge detection to detect license plates
     """
 
-    def __init__(self, image, label=""):
+    def __init__(self, image, label="", context=None, smoothing='bilateral'):
         """
         Initialize the detector with an image an a label
 
@@ -17,80 +18,34 @@ class CannyDetector(AbstractDetector):
         :param image: Image to be processed
         :type label: str
         :param label: Optional label for the image
+        :type context: utils.preprocess.PreprocessingContext | None
+        :param context: Optional preprocessing context of the image, shared with other detectors
+        :type smoothing: str
+        :param smoothing: Optional name of the smoothing backend blurring the image, one of
+            utils.smoothing.smoothing_backends. Default is the bilateral filter
         """
 
-        self.image = loader.load_image(image)
+        self.image = loader.load_image(image, read_only=True)
         self.label = label
+        self.context = context if context is not None else PreprocessingContext(self.image)
+        self.smoothing = smoothing
 
-    def _check_size(self, candidate, area=None):
+    def find_rectangles(self):
         """
-        Check size with respect to aspect ratio of a standard license plate
+        Find the locations of the license plates in the image, without cropping and zooming the plates
 
-        :type candidate: list[numpy.array]
-        :param candidate: ApproxPolyDP on which to perform the check
-        :rtype: bool
-        :return: True if conditions satisfied, otherwise False
+        :rtype: list[numpy.array]
+        :return: List of the plate rectangle locations
         """
 
-        # TODO: Adjust error rate
-        error_min = 0.17
-        error_max = 0.32
-
-        # Macedonian car plate size: 52x11 cm, aspect ratio = 4,72727272727
-        aspect = float(52) / float(11)
-
-        # TODO: Adjust coefficients for min and max area
-        min_area = 15 * aspect * 15
-        max_area = 112 * aspect * 112
-
-        # Set aspect ratios with account to error.
-        min_ratio = aspect - aspect * error_min
-        max_ratio = aspect + aspect * error_max
-
-        x_coordinates = [x for x in candidate[:, 0, 0]]
-        y_coordinates = [y for y in candidate[:, 0, 1]]
-        coordinates = [(x_coordinates[i], y_coordinates[i]) for i in range(len(x_coordinates))]
-
-        candidate_width, candidate_height = image.calculate_size(coordinates)
-        if candidate_height == 0.0 or candidate_width == 0.0:
-            return False
-
-        # Calculate candidate area
-        candidate_area = candidate_height * candidate_width if area is None else area
-        candidate_ratio = float(candidate_width) / float(candidate_height)
-        if candidate_ratio < 1:
-            candidate_ratio = 1 / candidate_ratio
-
-        if not min_area <= candidate_area <= max_area or not min_ratio <= candidate_ratio <= max_ratio:
-            return False
-        else:
-            if __debug__:
-                print "Candidate width: %.3f, height: %.3f" % (candidate_width, candidate_height)
-                print "Candidate area: %f" % candidate_area
-                print "Candidate ratio: %f" % candidate_ratio
-                print "Passed\n"
-            return True
-
-    def find_plates(self):
-        """
-        Find the license plates in the image
-
-        :rtype: list[(numpy.array, numpy.array)]
-        :return: List of tuples containing the plate image and the plate rectangle location
-            The plates returned must be a grayscale image with black background and white characters
-        """
-
-        # Create a grayscale version of the image
-        gray_img = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
-
-        # Blur the image
-        gray_img = cv2.adaptiveBilateralFilter(gray_img, (11, 11), 100)
+        # Create a blurred grayscale version of the image
+        gray_img = self.context.smooth((11, 11), 100, self.smoothing)
 
         if __debug__:
             display.show_image(gray_img, 'Gray')
 
         blur_kernel_size = (3, 3)
-        thresh = cv2.adaptiveThreshold(gray_img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 17, 2)
+        thresh = self.context.adaptive_threshold((11, 11), 100, 17, 2, self.smoothing)
         blurred = cv2.GaussianBlur(thresh, blur_kernel_size, 0)
 
         if __debug__:
@@ -104,7 +59,7 @@ class CannyDetector(AbstractDetector):
         if __debug__:
             display.draw_contours(self.image, contours)
 
-        rectangles = []
+        candidates = []
         for i in contours:
             area = cv2.contourArea(i)
             if area > 50:
@@ -112,9 +67,22 @@ class CannyDetector(AbstractDetector):
                 approx = cv2.approxPolyDP(i, 0.02 * peri, True)
 
                 if len(approx) == 4 and cv2.isContourConvex(approx):
-                    if self._check_size(approx):
-                        rectangles.append(approx)
+                    candidates.append(approx)
+
+        # Check the size of all candidates at once
+        passed = self._check_sizes(candidates)
+        return [candidate for i, candidate in enumerate(candidates) if passed[i]]
+
+    def find_plates(self):
+        """
+        Find the license plates in the image
+
+        :rtype: list[(numpy.array, numpy.array)]
+        :return: List of tuples containing the plate image and the plate rectangle location
+            The plates returned must be a grayscale image with black background and white characters
+        """
 
+        rectangles = self.find_rectangles()
         processing_plates = display.get_parts_of_image(self.image, rectangles)
         ret = []
 
@@ -129,7 +97,7 @@ class CannyDetector(AbstractDetector):
             # If the area of the plate is below 4500, perform hq2x on the plate
             if img_area < 4500:
                 ret.append((
-                    cv2.cvtColor(image.hq2x_zoom(processing_plate), cv2.COLOR_BGR2GRAY),
+                    image.hq2x_zoom(processing_plate, binary=True),
                     rectangles[i]
                 ))
             else:
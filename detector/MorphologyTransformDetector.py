@@ -3,6 +3,7 @@ import numpy as np
 
 from detector import AbstractDetector
 from utils import loader, display, image
+from utils.preprocess import PreprocessingContext
 
 
 class MorphologyTransformDetector(AbstractDetector):
@@ -10,7 +11,7 @@ class MorphologyTransformDetector(AbstractDetector):
     Detector that uses morphological image transformations to try and detect license plates
     """
 
-    def __init__(self, image, label=""):
+    def __init__(self, image, label="", context=None, warp_rotated=False, smoothing='bilateral'):
         """
         Initialize the detector with an image an a label
 
@@ -18,74 +19,32 @@ class MorphologyTransformDetector(AbstractDetector):
         :param image: Image to be processed
         :type label: str
         :param label: Optional label for the image
+        :type context: utils.preprocess.PreprocessingContext | None
+        :param context: Optional preprocessing context of the image, shared with other detectors
+        :type warp_rotated: bool
+        :param warp_rotated: Optional flag to warp the rotated plate rectangles upright instead of
+            cropping their upright bounding boxes
+        :type smoothing: str
+        :param smoothing: Optional name of the smoothing backend blurring the image, one of
+            utils.smoothing.smoothing_backends. Default is the bilateral filter
         """
 
-        self.image = loader.load_image(image)
+        self.image = loader.load_image(image, read_only=True)
         self.label = label
+        self.context = context if context is not None else PreprocessingContext(self.image)
+        self.warp_rotated = warp_rotated
+        self.smoothing = smoothing
 
-    def _check_size(self, candidate, area=None):
+    def find_rectangles(self):
         """
-        Check size with respect to aspect ratio of a standard license plate
+        Find the locations of the license plates in the image, without cropping and zooming the plates
 
-        :type candidate: list[numpy.array]
-        :param candidate: ApproxPolyDP on which to perform the check
-        :rtype: bool
-        :return: True if conditions satisfied, otherwise False
+        :rtype: list[numpy.array]
+        :return: List of the plate rectangle locations
         """
 
-        # TODO: Adjust error rate
-        error_min = 0.17
-        error_max = 0.32
-        # Macedonian car plate size: 52x11 cm, aspect ratio = 4,72727272727
-        aspect = float(52) / float(11)
-
-        # TODO: Adjust coefficients for min and max area
-        min_area = 15 * aspect * 15
-        max_area = 112 * aspect * 112
-
-        # Set aspect ratios with account to error.
-        min_ratio = aspect - aspect * error_min
-        max_ratio = aspect + aspect * error_max
-
-        x_coordinates = [x for x in candidate[:, 0, 0]]
-        y_coordinates = [y for y in candidate[:, 0, 1]]
-        coordinates = [(x_coordinates[i], y_coordinates[i]) for i in range(len(x_coordinates))]
-
-        candidate_width, candidate_height = image.calculate_size(coordinates)
-        candidate_area = candidate_height * candidate_width if area is None else area
-        if candidate_height == 0.0 or candidate_width == 0.0:
-            return False
-
-        candidate_ratio = float(candidate_width) / float(candidate_height)
-        if candidate_ratio < 1:
-            candidate_ratio = 1 / candidate_ratio
-
-        if not min_area <= candidate_area <= max_area or not min_ratio <= candidate_ratio <= max_ratio:
-            return False
-        else:
-            if __debug__:
-                print("Candidate width: %.3f, height: %.3f" % (candidate_width, candidate_height))
-                print("Candidate area: %f" % candidate_area)
-                print("Candidate ratio: %f" % candidate_ratio)
-                print("Passed\n")
-            return True
-
-    def find_plates(self):
-        """
-        Find the license plates in the image
-
-        :rtype: list[(numpy.array, numpy.array)]
-        :return: List of tuples containing the plate image and the plate rectangle location
-            The plates returned must be a grayscale image with black background and white characters
-        """
-
-        # Create a grayscale version of the image
-        processing_img = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
-        img_height, img_width = processing_img.shape
-        img_area = img_height * img_width
-
-        # Blur the image
-        processing_img = cv2.adaptiveBilateralFilter(processing_img, (11, 11), 100)
+        # Create a blurred grayscale version of the image
+        processing_img = self.context.smooth((11, 11), 100, self.smoothing)
 
         if __debug__:
             display.show_image(processing_img, self.label, 'Gray')
@@ -119,16 +78,29 @@ class MorphologyTransformDetector(AbstractDetector):
         if __debug__:
             display.draw_contours(self.image, contours, self.label)
 
-        rectangles = []
+        boxes = []
         for itc in contours:
             mr = cv2.minAreaRect(itc)  # Minimum enclosing rectangle
             # mr = (top-left x, top-left y), (width, height), angle-of-rotation
-            box = cv2.cv.BoxPoints(mr)
-            box_points = np.array([[(box[i][0], box[i][1])] for i in range(len(box))])
-            if self._check_size(box_points):
-                rectangles.append(np.int0(box))  # Rotated minimum enclosing rectangle
+            boxes.append(cv2.cv.BoxPoints(mr))
+
+        # Check the size of all boxes at once
+        passed = self._check_sizes(np.array(boxes))
+        return [np.int0(box) for i, box in enumerate(boxes) if passed[i]]  # Rotated minimum enclosing rectangles
+
+    def find_plates(self):
+        """
+        Find the license plates in the image
+
+        :rtype: list[(numpy.array, numpy.array)]
+        :return: List of tuples containing the plate image and the plate rectangle location
+            The plates returned must be a grayscale image with black background and white characters
+        """
+
+        rectangles = self.find_rectangles()
+        processing_img = self.context.smooth((11, 11), 100, self.smoothing)
 
-        processing_plates = display.get_parts_of_image(processing_img, rectangles)
+        processing_plates = display.get_parts_of_image(processing_img, rectangles, self.warp_rotated)
         ret = []
         # if __debug__:
         # display.display_rectangles(self.image, rectangles)
@@ -142,7 +114,7 @@ class MorphologyTransformDetector(AbstractDetector):
                 img_area = img_height * img_width
 
                 if img_area < 4500:
-                    ret.append((cv2.cvtColor(image.hq2x_zoom(processing_plate), cv2.COLOR_BGR2GRAY), rectangles[i]))
+                    ret.append((image.hq2x_zoom(processing_plate, binary=True), rectangles[i]))
                 else:
                     ret.append((processing_plate, rectangles[i]))
 
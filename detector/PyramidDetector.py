@@ -0,0 +1,223 @@
+import math
+
+import cv2
+import numpy as np
+
+from detector import AbstractDetector, ThresholdBlurDetector
+from utils import loader, display
+from utils.preprocess import PreprocessingContext
+
+
+class PyramidDetector(AbstractDetector):
+    """
+    Detector that runs another detector on a downscaled level of an image pyramid,
+    and again on the full resolution image around the plates it finds there
+    """
+
+    # Frame size for which the plate size limits of the detectors are meant. Plates in bigger frames of the
+    # same scene are expected to be proportionally bigger
+    reference_frame_area = 1024 * 768
+
+    # Pixels of the full resolution image around every plate found on the downscaled level, for the filters of the
+    # detector refining it. The widest is the 50 pixel closing kernel of MorphologyTransformDetector
+    refine_margin = 64
+
+    def __init__(self, image, label="", context=None, detector_class=ThresholdBlurDetector, min_plate_area=None,
+                 max_plate_area=None):
+        """
+        Initialize the detector with an image an a label
+
+        :type image: numpy.ndarray
+        :param image: Image to be processed
+        :type label: str
+        :param label: Optional label for the image
+        :type context: utils.preprocess.PreprocessingContext | None
+        :param context: Optional preprocessing context of the full resolution image, shared with other detectors.
+            Used when the image is not downscaled
+        :type detector_class: type
+        :param detector_class: Optional detector to run on the downscaled image. Default is ThresholdBlurDetector
+        :type min_plate_area: float | None
+        :param min_plate_area: Optional area of the smallest plate expected in the full resolution image.
+            Default scales the minimum plate area of the detectors by how much bigger the image is
+            than reference_frame_area
+        :type max_plate_area: float | None
+        :param max_plate_area: Optional area of the biggest plate expected in the full resolution image.
+            Default scales the maximum plate area of the detectors like min_plate_area
+        """
+
+        self.image = loader.load_image(image, read_only=True)
+        self.label = label
+        self.context = context if context is not None else PreprocessingContext(self.image)
+        self.detector_class = detector_class
+
+        if min_plate_area is None:
+            img_height, img_width = self.image.shape[:2]
+            min_plate_area = self.min_area * max(1.0, float(img_height * img_width) / self.reference_frame_area)
+        if max_plate_area is None:
+            max_plate_area = self.max_area * min_plate_area / self.min_area
+        self.min_plate_area = min_plate_area
+        self.max_plate_area = max_plate_area
+        self.levels = self.choose_levels(min_plate_area)
+
+    @classmethod
+    def choose_levels(cls, min_plate_area):
+        """
+        Choose how many times the image can be halved so that the smallest expected plate
+        is still not smaller than the minimum plate area of the detectors
+
+        :type min_plate_area: float
+        :param min_plate_area: Area of the smallest plate expected in the full resolution image
+        :rtype: int
+        :return: Number of pyramid levels, 0 for the full resolution image
+        """
+
+        if min_plate_area <= cls.min_area:
+            return 0
+
+        # Every level divides the area of a plate by 4
+        return int(math.floor(math.log(float(min_plate_area) / cls.min_area, 4)))
+
+    def _coarse_rectangles(self):
+        """
+        Find the plates on the downscaled image, with the plate area limits scaled down to it
+
+        :rtype: list[numpy.array]
+        :return: List of the plate rectangle locations, in the coordinates of the full resolution image
+        """
+
+        small_img = self.image
+        for level in range(self.levels):
+            small_img = cv2.pyrDown(small_img)
+
+        area_factor = 4.0 ** self.levels
+        detector = self.detector_class(small_img, self.label)
+        detector.set_area_limits(self.min_plate_area / area_factor, self.max_plate_area / area_factor)
+
+        # Pixel i of a level is centered on pixel 2i of the level below, so the coordinates are only scaled.
+        # The refinement corrects the error of up to a pixel of the downscaled level
+        factor = 2 ** self.levels
+        rectangles = [np.int32(np.round(rectangle * factor)) for rectangle in detector.find_rectangles()]
+
+        if __debug__:
+            print("Pyramid level %d: %d plates" % (self.levels, len(rectangles)))
+        return rectangles
+
+    def get_regions(self):
+        """
+        Find the areas of the full resolution image to refine the plates found on the downscaled image in.
+        The bounding boxes of the plates are widened by a margin, and overlapping ones are merged
+
+        :rtype: list[(int, int, int, int)]
+        :return: List of x_min, y_min, x_max, y_max of every area
+        """
+
+        rectangles = self._coarse_rectangles()
+        if len(rectangles) == 0:
+            return []
+
+        margin = 2 ** self.levels + self.refine_margin
+        boxes = display.get_bounding_boxes(rectangles)
+        boxes[:, :2] -= margin
+        boxes[:, 2:] += margin
+        boxes = display.get_bounding_boxes(boxes.reshape(-1, 2, 2), self.image.shape)
+
+        regions = []
+        for box in boxes.tolist():
+            # Merge the box with every region it overlaps, until it overlaps none
+            merged = True
+            while merged:
+                merged = False
+                for region in regions:
+                    if box[0] < region[2] and region[0] < box[2] and box[1] < region[3] and region[1] < box[3]:
+                        regions.remove(region)
+                        box = [min(box[0], region[0]), min(box[1], region[1]),
+                               max(box[2], region[2]), max(box[3], region[3])]
+                        merged = True
+                        break
+            regions.append(box)
+        return [tuple(region) for region in regions]
+
+    def _region_detector(self, region):
+        """
+        Create the detector refining the plates of an area, with the plate area limits of the full resolution image
+
+        :type region: (int, int, int, int)
+        :param region: x_min, y_min, x_max, y_max of the area
+        :rtype: detector.AbstractDetector
+        :return: Detector of the area
+        """
+
+        x_min, y_min, x_max, y_max = region
+        region_img = self.image[y_min:y_max, x_min:x_max]
+        detector = self.detector_class(region_img, self.label, PreprocessingContext(region_img))
+        detector.set_area_limits(self.min_plate_area, self.max_plate_area)
+        return detector
+
+    def _move_region_rectangles(self, region, rectangles):
+        """
+        Move the rectangles found in an area to the coordinates of the whole image
+
+        Rectangles touching a side of the area which is not a side of the image are dropped, since they are cut.
+
+        :type region: (int, int, int, int)
+        :param region: x_min, y_min, x_max, y_max of the area
+        :type rectangles: list[numpy.array]
+        :param rectangles: Rectangles found in the area
+        :rtype: list[(int, numpy.array)]
+        :return: List of tuples containing the index of every kept rectangle and the moved rectangle
+        """
+
+        if len(rectangles) == 0:
+            return []
+
+        x_min, y_min, x_max, y_max = region
+        img_height, img_width = self.image.shape[:2]
+
+        boxes = display.get_bounding_boxes(rectangles)
+        cut = ((boxes[:, 0] <= 0) & (x_min > 0)) | ((boxes[:, 1] <= 0) & (y_min > 0)) | \
+            ((boxes[:, 2] >= x_max - x_min - 1) & (x_max < img_width)) | \
+            ((boxes[:, 3] >= y_max - y_min - 1) & (y_max < img_height))
+
+        offset = np.array([x_min, y_min])
+        return [(i, (np.reshape(rectangle, (-1, 2)) + offset).reshape(np.shape(rectangle)).astype(np.int32))
+                for i, (rectangle, is_cut) in enumerate(zip(rectangles, cut)) if not is_cut]
+
+    def find_rectangles(self):
+        """
+        Find the locations of the license plates in the image, without cropping and zooming the plates
+
+        The plates are found on the downscaled image, then found again at full resolution around them,
+        so the locations are as precise and filtered by the same size limits as at full resolution
+
+        :rtype: list[numpy.array]
+        :return: List of the plate rectangle locations in the full resolution image
+        """
+
+        if self.levels == 0:
+            return self.detector_class(self.image, self.label, self.context).find_rectangles()
+
+        rectangles = []
+        for region in self.get_regions():
+            region_rectangles = self._region_detector(region).find_rectangles()
+            rectangles.extend(rectangle for i, rectangle in self._move_region_rectangles(region, region_rectangles))
+        return rectangles
+
+    def find_plates(self):
+        """
+        Find the license plates in the image
+
+        :rtype: list[(numpy.array, numpy.array)]
+        :return: List of tuples containing the plate image and the plate rectangle location
+            The plates returned must be a grayscale image with black background and white characters
+        """
+
+        if self.levels == 0:
+            return self.detector_class(self.image, self.label, self.context).find_plates()
+
+        # The detector crops the plates of every area at full resolution, the way it does on a whole image
+        ret = []
+        for region in self.get_regions():
+            plates = self._region_detector(region).find_plates()
+            moved = self._move_region_rectangles(region, [rectangle for plate, rectangle in plates])
+            ret.extend((plates[i][0], rectangle) for i, rectangle in moved)
+        return ret
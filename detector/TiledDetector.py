@@ -0,0 +1,228 @@
+import math
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from detector import AbstractDetector, ThresholdBlurDetector
+from utils import loader, display
+from utils.preprocess import PreprocessingContext
+
+
+class TiledDetector(AbstractDetector):
+    """
+    Detector that splits a large image into overlapping tiles and runs another detector on them in parallel
+
+    Every plate is kept from the tile whose core holds the center of its bounding box,
+    so that the plates found twice in the overlap of two tiles are returned once.
+    """
+
+    # Diagonal of the biggest plate passing the size check, the widest and highest its bounding box gets when rotated.
+    # Width * height is at most max_area and width / height at most max_ratio, so width^2 + height^2 is at most:
+    max_plate_side = int(math.ceil(math.sqrt(
+        AbstractDetector.max_area * (AbstractDetector.max_ratio + 1 / AbstractDetector.max_ratio))))
+
+    def __init__(self, image, label="", context=None, detector_class=ThresholdBlurDetector, tile_size=None,
+                 workers=None):
+        """
+        Initialize the detector with an image an a label
+
+        :type image: numpy.ndarray
+        :param image: Image to be processed
+        :type label: str
+        :param label: Optional label for the image
+        :type context: utils.preprocess.PreprocessingContext | None
+        :param context: Optional preprocessing context, used when the image fits in a single tile
+        :type detector_class: type
+        :param detector_class: Optional detector to run on the tiles. Default is ThresholdBlurDetector
+        :type tile_size: int | None
+        :param tile_size: Optional side of the square tiles, at least twice max_plate_side. Default is the minimum
+        :type workers: int | None
+        :param workers: Optional number of threads. Default is the number of CPUs
+        """
+
+        self.image = loader.load_image(image, read_only=True)
+        self.label = label
+        self.context = context
+        self.detector_class = detector_class
+        self.workers = workers or cpu_count()
+
+        # Tiles overlap by the biggest plate at any rotation, so that every plate lies whole in at least one tile
+        self.overlap = self.max_plate_side
+        self.tile_size = max(tile_size or 0, 2 * self.overlap)
+
+    def get_tiles(self):
+        """
+        Split the image into overlapping tiles covering it
+
+        :rtype: list[(int, int, int, int)]
+        :return: List of x_min, y_min, x_max, y_max of every tile
+        """
+
+        img_height, img_width = self.image.shape[:2]
+        return [(x, y, min(x + self.tile_size, img_width), min(y + self.tile_size, img_height))
+                for y in self._starts(img_height) for x in self._starts(img_width)]
+
+    def _starts(self, length):
+        """
+        Find where the tiles start along a side of the image
+
+        :type length: int
+        :param length: Length of the side
+        :rtype: list[int]
+        :return: Sorted starts of the tiles
+        """
+
+        # Shift the last tile back so that it ends at the border of the image instead of leaving it
+        stride = self.tile_size - self.overlap
+        return sorted(set(min(start, max(length - self.tile_size, 0))
+                          for start in range(0, max(length - self.overlap, 1), stride)))
+
+    def _core(self, start, length):
+        """
+        Find the part of a side of a tile that the tile owns: the middle of its overlap with the previous tile
+        up to the middle of its overlap with the next one
+
+        A plate whose bounding box is centered in the core of a tile lies whole in that tile,
+        since the tiles overlap by more than the bounding box of any plate.
+
+        :type start: int
+        :param start: Start of the tile along the side of the image
+        :type length: int
+        :param length: Length of the side of the image
+        :rtype: (float, float)
+        :return: Start and end of the core, in the coordinates of the image. The end is not part of it
+        """
+
+        starts = self._starts(length)
+        index = starts.index(start)
+        lower = (starts[index - 1] + self.tile_size + start) / 2.0 if index > 0 else -np.inf
+        upper = (start + self.tile_size + starts[index + 1]) / 2.0 if index + 1 < len(starts) else np.inf
+        return lower, upper
+
+    def _move_tile_rectangles(self, tile, rectangles):
+        """
+        Move the rectangles found on a tile to the coordinates of the whole image
+
+        Only the rectangles whose bounding box is centered in the core of the tile are kept, so that every plate
+        is kept from a single tile, the one holding it whole. Rectangles touching a side of the tile which
+        is not a side of the image are dropped as well, since they are cut.
+
+        :type tile: (int, int, int, int)
+        :param tile: x_min, y_min, x_max, y_max of the tile
+        :type rectangles: list[numpy.array]
+        :param rectangles: Rectangles found on the tile
+        :rtype: list[(int, numpy.array)]
+        :return: List of tuples containing the index of every kept rectangle and the moved rectangle
+        """
+
+        if len(rectangles) == 0:
+            return []
+
+        x_min, y_min, x_max, y_max = tile
+        img_height, img_width = self.image.shape[:2]
+
+        boxes = display.get_bounding_boxes(rectangles)
+        cut = ((boxes[:, 0] <= 0) & (x_min > 0)) | ((boxes[:, 1] <= 0) & (y_min > 0)) | \
+            ((boxes[:, 2] >= x_max - x_min - 1) & (x_max < img_width)) | \
+            ((boxes[:, 3] >= y_max - y_min - 1) & (y_max < img_height))
+
+        (core_x_min, core_x_max), (core_y_min, core_y_max) = self._core(x_min, img_width), self._core(y_min, img_height)
+        center_x = (boxes[:, 0] + boxes[:, 2]) / 2.0 + x_min
+        center_y = (boxes[:, 1] + boxes[:, 3]) / 2.0 + y_min
+        owned = (core_x_min <= center_x) & (center_x < core_x_max) & (core_y_min <= center_y) & (center_y < core_y_max)
+
+        offset = np.array([x_min, y_min])
+        return [(i, (np.reshape(rectangle, (-1, 2)) + offset).reshape(np.shape(rectangle)).astype(np.int32))
+                for i, rectangle in enumerate(rectangles) if owned[i] and not cut[i]]
+
+    def _tile_detector(self, tile):
+        """
+        Create the detector of a tile
+
+        :type tile: (int, int, int, int)
+        :param tile: x_min, y_min, x_max, y_max of the tile
+        :rtype: detector.AbstractDetector
+        :return: Detector of the tile image
+        """
+
+        x_min, y_min, x_max, y_max = tile
+        tile_img = self.image[y_min:y_max, x_min:x_max]
+        return self.detector_class(tile_img, self.label, PreprocessingContext(tile_img))
+
+    def _find_tile_plates(self, tile):
+        """
+        Run the detector on a tile and move the plate rectangles to the coordinates of the whole image
+
+        :type tile: (int, int, int, int)
+        :param tile: x_min, y_min, x_max, y_max of the tile
+        :rtype: list[(numpy.array, numpy.array)]
+        :return: List of tuples containing the plate image and the plate rectangle location
+        """
+
+        plates = self._tile_detector(tile).find_plates()
+        return [(plates[i][0], rectangle)
+                for i, rectangle in self._move_tile_rectangles(tile, [rectangle for plate, rectangle in plates])]
+
+    def _find_tile_rectangles(self, tile):
+        """
+        Run the detector on a tile without cropping the plates and move the rectangles to the coordinates
+        of the whole image
+
+        :type tile: (int, int, int, int)
+        :param tile: x_min, y_min, x_max, y_max of the tile
+        :rtype: list[numpy.array]
+        :return: List of the plate rectangle locations
+        """
+
+        rectangles = self._tile_detector(tile).find_rectangles()
+        return [rectangle for i, rectangle in self._move_tile_rectangles(tile, rectangles)]
+
+    def _map_tiles(self, find_tile):
+        """
+        Run a detection on all tiles in parallel
+
+        :type find_tile: (int, int, int, int) -> list
+        :param find_tile: Function detecting the plates of a tile, keeping the ones the tile owns
+        :rtype: list
+        :return: Plates found by find_tile, tile by tile
+        """
+
+        tiles = self.get_tiles()
+
+        # OpenCV releases the GIL, so the tiles are processed in threads sharing the image
+        pool = ThreadPool(min(self.workers, len(tiles)))
+        try:
+            plates = [plate for tile_plates in pool.map(find_tile, tiles) for plate in tile_plates]
+        finally:
+            pool.close()
+            pool.join()
+
+        if __debug__:
+            print("Tiles: %d, plates: %d" % (len(tiles), len(plates)))
+        return plates
+
+    def find_rectangles(self):
+        """
+        Find the locations of the license plates in the image, without cropping and zooming the plates
+
+        :rtype: list[numpy.array]
+        :return: List of the plate rectangle locations
+        """
+
+        if len(self.get_tiles()) == 1:
+            return self.detector_class(self.image, self.label, self.context).find_rectangles()
+        return self._map_tiles(self._find_tile_rectangles)
+
+    def find_plates(self):
+        """
+        Find the license plates in the image
+
+        :rtype: list[(numpy.array, numpy.array)]
+        :return: List of tuples containing the plate image and the plate rectangle location
+            The plates returned must be a grayscale image with black background and white characters
+        """
+
+        if len(self.get_tiles()) == 1:
+            return self.detector_class(self.image, self.label, self.context).find_plates()
+        return self._map_tiles(self._find_tile_plates)
@@ -2,4 +2,6 @@ __author__ = 'Robert'
 from AbstractDetector import AbstractDetector
 from MorphologyTransformDetector import MorphologyTransformDetector
 from ThresholdBlurDetector import ThresholdBlurDetector
-from CannyDetector import CannyDetector
\ No newline at end of file
+from CannyDetector import CannyDetector
+from PyramidDetector import PyramidDetector
+from TiledDetector import TiledDetector
\ No newline at end of file
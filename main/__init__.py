@@ -1,2 +1,3 @@
 __author__ = 'Robert'
-from main import main
+from main import main, process_image, fuse_plates, segment_plate
+from batch import run_batch
\ No newline at end of file
@@ -0,0 +1,74 @@
+import time
+from multiprocessing import Pool
+
+import cv2
+
+from main import process_image
+from recognizer import get_default_pool
+
+# Processing options of the current worker process, set by _init_worker
+_worker_options = {}
+
+
+def _init_worker(selected_detectors, batch_ocr, template_index, deskew):
+    """
+    Prepare a worker process of the pool
+    """
+
+    _worker_options.update(selected_detectors=selected_detectors, batch_ocr=batch_ocr,
+                           template_index=template_index, deskew=deskew)
+
+    # Initialize the Tesseract engines of this worker once, before its first image
+    get_default_pool()
+
+
+def _process_file(image_name):
+    """
+    Load and process a single image in a worker process
+
+    :type image_name: str
+    :param image_name: Path of the image
+    :rtype: (str, set[str], float)
+    :return: The image path, the text of the detected plates and the processing time in seconds
+    """
+
+    start_time = time.time()
+    src = cv2.imread(image_name)
+    plates_text = process_image(src, image_name, **_worker_options) if src is not None else set([])
+    return image_name, plates_text, time.time() - start_time
+
+
+def run_batch(image_names, workers=None, chunk_size=16, selected_detectors=None, batch_ocr=False,
+              template_index=None, deskew='text'):
+    """
+    Process images in parallel in a pool of worker processes
+
+    Every worker loads its own images and owns its own Tesseract engines and detectors.
+    Debug displays block the workers, so batches should be run with the -O flag.
+
+    :type image_names: list[str]
+    :param image_names: Paths of the images
+    :type workers: int | None
+    :param workers: Optional number of worker processes. Default is the number of CPUs
+    :type chunk_size: int
+    :param chunk_size: Optional number of images sent to a worker at once
+    :type selected_detectors: list[type] | None
+    :param selected_detectors: Optional detector classes to use. Default is all of them
+    :type batch_ocr: bool
+    :param batch_ocr: Optional flag to recognize all characters of a plate at once instead of one by one
+    :type template_index: recognizer.TemplateIndex | None
+    :param template_index: Optional index of character glyphs to recognize the characters with instead of Tesseract
+    :type deskew: str
+    :param deskew: Optional name of the skew correction, one of utils.transform.deskew_methods
+    :rtype: collections.Iterable[(str, set[str], float)]
+    :return: Image path, text of the detected plates and processing time in seconds of every image,
+        in the order of the given paths, as soon as they are available
+    """
+
+    pool = Pool(workers, _init_worker, (selected_detectors, batch_ocr, template_index, deskew))
+    try:
+        for result in pool.imap(_process_file, image_names, chunk_size):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,325 @@
+import math
+import resource
+import time
+from multiprocessing import Process, Queue
+
+import cv2
+import numpy as np
+
+from detector import ThresholdBlurDetector, MorphologyTransformDetector, CannyDetector
+from utils.display import get_bounding_boxes
+from utils.image import box_iou
+from utils.loader import iter_images, get_images_from_dir, load_image
+from utils.preprocess import PreprocessingContext
+from utils.smoothing import smoothing_backends
+from utils.transform import deskew_methods
+from main import fuse_plates, segment_plate
+
+
+def _matched(boxes, reference_boxes, threshold):
+    """
+    Count the reference boxes overlapping any of the boxes by more than the threshold
+    """
+
+    if len(boxes) == 0:
+        return 0
+    return sum(1 for reference in reference_boxes if box_iou(reference, boxes).max() > threshold)
+
+
+def benchmark_smoothing(image_names, backends=None, detector_classes=None, reference='bilateral',
+                        overlap_threshold=0.5):
+    """
+    Compare the smoothing backends of the detectors by speed and detection recall
+
+    The plate set has no annotations, so the recall of a backend is the fraction of the plates found
+    with the reference backend that are also found with it. Run it with the -O flag,
+    so that the debug windows are not shown.
+
+    :type image_names: list[str]
+    :param image_names: Paths of the images
+    :type backends: list[str] | None
+    :param backends: Optional names of the backends to compare. Default is all of them
+    :type detector_classes: list[type] | None
+    :param detector_classes: Optional detectors to compare the backends with. Default is all of them
+    :type reference: str
+    :param reference: Optional name of the backend whose plates are taken as the ground truth
+    :type overlap_threshold: float
+    :param overlap_threshold: Optional intersection over union above which two plates are the same
+    :rtype: dict[str, dict[str, float]]
+    :return: For every backend the seconds spent smoothing, the seconds spent detecting,
+        the number of plates found and the recall
+    """
+
+    if backends is None:
+        backends = sorted(smoothing_backends)
+    if detector_classes is None:
+        detector_classes = [ThresholdBlurDetector, CannyDetector, MorphologyTransformDetector]
+
+    stats = dict((backend, dict(smoothing=0.0, detection=0.0, plates=0, matched=0)) for backend in backends)
+    reference_plates = 0
+    for image_name, src in iter_images(image_names):
+        boxes = {}
+        for backend in set(backends) | set([reference]):
+            context = PreprocessingContext(src)
+
+            # Smooth once with the kernel of every detector, so that the detectors find it memoized
+            start_time = time.time()
+            for kernel_size, sigma in [((7, 7), 15), ((11, 11), 100)]:
+                context.smooth(kernel_size, sigma, backend)
+            smoothing_time = time.time() - start_time
+
+            rectangles = []
+            start_time = time.time()
+            for detector_class in detector_classes:
+                detector = detector_class(src, image_name, context, smoothing=backend)
+                rectangles.extend(detector.find_rectangles())
+            detection_time = time.time() - start_time
+
+            boxes[backend] = get_bounding_boxes(rectangles)
+            if backend in stats:
+                stats[backend]['smoothing'] += smoothing_time
+                stats[backend]['detection'] += detection_time
+                stats[backend]['plates'] += len(rectangles)
+
+        reference_plates += len(boxes[reference])
+        for backend in backends:
+            stats[backend]['matched'] += _matched(boxes[backend], boxes[reference], overlap_threshold)
+
+    for backend in backends:
+        stats[backend]['recall'] = float(stats[backend].pop('matched')) / reference_plates if reference_plates else 1.0
+    return stats
+
+
+def _synthetic_plate(text, angle, shear):
+    """
+    Draw a binary plate with white text on black, rotated by the angle and slanted by the shear in degrees,
+    and crop its upright bounding box like the detectors do
+    """
+
+    plate = np.zeros((70, 320), np.uint8)
+    cv2.putText(plate, text, (18, 52), cv2.FONT_HERSHEY_SIMPLEX, 1.4, 255, 4)
+
+    radians = math.radians(angle)
+    width = int(math.ceil(320 * abs(math.cos(radians)) + 70 * abs(math.sin(radians))))
+    height = int(math.ceil(320 * abs(math.sin(radians)) + 70 * abs(math.cos(radians))))
+
+    # Slant the characters around the middle row, then rotate around the center of the bounding box
+    slant = math.tan(math.radians(shear))
+    shear_mat = np.array([[1, slant, -slant * 35], [0, 1, 0], [0, 0, 1]], np.float64)
+    rotation_mat = np.vstack((cv2.getRotationMatrix2D((160.0, 35.0), -angle, 1), [0, 0, 1]))
+    rotation_mat[:2, 2] += ((width - 320) / 2.0, (height - 70) / 2.0)
+    plate = cv2.warpAffine(plate, rotation_mat.dot(shear_mat)[:2], (width, height))
+    return np.where(plate > 127, 255, 0).astype(np.uint8)
+
+
+def _text_angle(plate):
+    """
+    Measure the angle of the text rows in degrees, from a line fit through the centers of the characters
+    """
+
+    contours, hierarchy = cv2.findContours(plate.copy(), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    moments = [cv2.moments(contour) for contour in contours]
+    centroids = np.array([(m['m10'] / m['m00'], m['m01'] / m['m00']) for m in moments if m['m00'] > 20])
+    if len(centroids) < 2:
+        return None
+    slope = np.polyfit(centroids[:, 0], centroids[:, 1], 1)[0]
+    return math.degrees(math.atan(slope))
+
+
+def benchmark_deskew(methods=None, angles=(-15, -10, -5, -2, 0, 2, 5, 10, 15), shears=(0, 10), repeat=3):
+    """
+    Compare the deskewing methods by speed and remaining angle of the text rows on synthetic plates
+
+    Run it with the -O flag, so that the debug windows are not shown.
+
+    :type methods: list[str] | None
+    :param methods: Optional names of the methods to compare, from utils.transform.deskew_methods. Default is all
+    :type angles: list[float]
+    :param angles: Optional rotations of the plates in degrees
+    :type shears: list[float]
+    :param shears: Optional slants of the characters in degrees
+    :type repeat: int
+    :param repeat: Optional number of times every plate is deskewed, for the timing
+    :rtype: dict[str, dict[str, float]]
+    :return: For every method the milliseconds per plate, and the mean and the maximum absolute angle
+        of the text rows after deskewing, in degrees. Plates left without text count as 90 degrees
+    """
+
+    if methods is None:
+        methods = sorted(deskew_methods)
+
+    texts = ["SK 1234 AB", "BT 5678 CD", "OH 9012 EF"]
+    plates = [_synthetic_plate(text, angle, shear) for text in texts for angle in angles for shear in shears]
+
+    stats = {}
+    for method in methods:
+        deskew = deskew_methods[method]
+        errors = []
+        start_time = time.time()
+        for plate in plates:
+            for i in range(repeat):
+                result = deskew(plate)
+            remaining = _text_angle(np.where(result > 127, 255, 0).astype(np.uint8))
+            errors.append(90.0 if remaining is None else abs(remaining))
+        stats[method] = dict(milliseconds=(time.time() - start_time) * 1000 / (len(plates) * repeat),
+                             mean_error=float(np.mean(errors)), max_error=float(np.max(errors)))
+    return stats
+
+
+def _synthetic_scene(text, angle):
+    """
+    Draw a 640x480 BGR scene with a white bordered plate in the middle, rotated by the angle in degrees
+    """
+
+    scene = np.full((480, 640, 3), 120, np.uint8)
+    cv2.rectangle(scene, (0, 336), (640, 480), (60, 60, 60), -1)
+
+    plate = np.zeros((480, 640, 3), np.uint8)
+    cv2.rectangle(plate, (190, 212), (450, 267), (255, 255, 255), -1)
+    cv2.rectangle(plate, (194, 216), (445, 262), (0, 0, 0), 2)
+    cv2.putText(plate, text, (208, 252), cv2.FONT_HERSHEY_SIMPLEX, 1.1, (0, 0, 0), 3)
+    mask = np.zeros((480, 640), np.uint8)
+    cv2.rectangle(mask, (190, 212), (450, 267), 255, -1)
+
+    rotation_mat = cv2.getRotationMatrix2D((320.0, 240.0), angle, 1)
+    plate = cv2.warpAffine(plate, rotation_mat, (640, 480))
+    mask = cv2.warpAffine(mask, rotation_mat, (640, 480))
+    scene[mask > 127] = plate[mask > 127]
+    return scene
+
+
+def benchmark_fusion(angles=(-12, -6, 0, 6, 12), detector_classes=None, overlap_threshold=0.3, deskew='text'):
+    """
+    Compare segmenting every plate found by the detectors with segmenting the fused plates, on synthetic scenes
+
+    Run it with the -O flag, so that the debug windows are not shown.
+
+    :type angles: list[float]
+    :param angles: Optional rotations of the plates in degrees
+    :type detector_classes: list[type] | None
+    :param detector_classes: Optional detectors to find the plates with. Default is all of them
+    :type overlap_threshold: float
+    :param overlap_threshold: Optional intersection over union above which two plates are fused
+    :type deskew: str
+    :param deskew: Optional name of the skew correction, one of utils.transform.deskew_methods
+    :rtype: dict[str, dict[str, float]]
+    :return: For 'separate' and 'fused', the number of plates left to recognize, the recall as the fraction of
+        the scenes where a plate gives a box for every character, and the mean of the most boxes a plate gives
+    """
+
+    if detector_classes is None:
+        detector_classes = [ThresholdBlurDetector, CannyDetector, MorphologyTransformDetector]
+
+    texts = ["SK 1234 AB", "BT 5678 CD", "OH 9012 EF"]
+    stats = dict((mode, dict(plates=0, recall=0.0, boxes=0.0)) for mode in ('separate', 'fused'))
+    scenes = 0
+    for text in texts:
+        characters = len(text.replace(" ", ""))
+        for angle in angles:
+            src = _synthetic_scene(text, angle)
+            context = PreprocessingContext(src)
+            plates = []
+            for detector_class in detector_classes:
+                plates.extend(detector_class(src, text, context).find_plates())
+
+            groups = dict(separate=[[plate] for plate in plates], fused=fuse_plates(plates, overlap_threshold))
+            for mode, plate_groups in groups.items():
+                found = max([len(segment_plate(candidates, deskew)[2]) for candidates in plate_groups] or [0])
+                stats[mode]['plates'] += len(plate_groups)
+                stats[mode]['recall'] += found >= characters
+                stats[mode]['boxes'] += found
+            scenes += 1
+
+    for mode in stats:
+        stats[mode]['recall'] /= float(scenes)
+        stats[mode]['boxes'] /= float(scenes)
+    return stats
+
+
+def _peak_memory():
+    """
+    Peak resident memory of the current process in megabytes
+    """
+
+    # Linux reports kilobytes
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _measure_memory(copies, shape, detector_classes, detect, results):
+    """
+    Measure the memory of the detectors of a single frame, in a process of its own
+    """
+
+    frame = np.full(shape, 128, np.uint8)
+    context = PreprocessingContext(frame)
+    start = _peak_memory()
+
+    # Before the detectors took read-only views, every one of them copied the frame
+    detectors = [detector_class(load_image(frame) if copies else frame, "", context)
+                 for detector_class in detector_classes]
+    created = _peak_memory()
+
+    if detect:
+        for detector in detectors:
+            detector.find_plates()
+    results.put((created - start, _peak_memory() - start))
+
+
+def benchmark_memory(shape=(3000, 4000, 3), detector_classes=None, detect=False):
+    """
+    Compare the memory used by the detectors of a frame when they copy it and when they share read-only views of it
+
+    Every mode runs in a new process, so that the peaks of one don't hide the other.
+    Run it with the -O flag, so that the debug windows are not shown.
+
+    :type shape: tuple
+    :param shape: Optional shape of the BGR frame. Default is a 12 MP frame
+    :type detector_classes: list[type] | None
+    :param detector_classes: Optional detectors to create. Default is all of them
+    :type detect: bool
+    :param detect: Optional flag to also run find_plates, which needs the detector dependencies
+    :rtype: dict[str, dict[str, float]]
+    :return: For 'copies' and 'views', the megabytes the peak memory grew by when creating the detectors,
+        and when also running them
+    """
+
+    if detector_classes is None:
+        detector_classes = [ThresholdBlurDetector, CannyDetector, MorphologyTransformDetector]
+
+    stats = {}
+    for mode in ('copies', 'views'):
+        results = Queue()
+        process = Process(target=_measure_memory, args=(mode == 'copies', shape, detector_classes, detect, results))
+        process.start()
+        created, detected = results.get()
+        process.join()
+        stats[mode] = dict(created=created, detected=detected)
+    return stats
+
+
+if __name__ == '__main__':
+    import sys
+
+    if sys.argv[1:] == ['memory']:
+        results = benchmark_memory()
+        print("%-10s %14s %14s" % ("Frame", "Created MB", "Detected MB"))
+        for name in sorted(results):
+            print("%-10s %14.1f %14.1f" % (name, results[name]['created'], results[name]['detected']))
+    elif sys.argv[1:] == ['fusion']:
+        results = benchmark_fusion()
+        print("%-10s %8s %8s %8s" % ("Plates", "Count", "Recall", "Boxes"))
+        for name in sorted(results):
+            print("%-10s %8d %8.3f %8.2f" % (name, results[name]['plates'], results[name]['recall'],
+                                             results[name]['boxes']))
+    elif sys.argv[1:] == ['deskew']:
+        results = benchmark_deskew()
+        print("%-10s %12s %12s %12s" % ("Deskew", "ms / plate", "Mean error", "Max error"))
+        for name in sorted(results, key=lambda item: results[item]['milliseconds']):
+            print("%-10s %12.3f %12.2f %12.2f" % (name, results[name]['milliseconds'], results[name]['mean_error'],
+                                                  results[name]['max_error']))
+    else:
+        results = benchmark_smoothing(sorted(get_images_from_dir('main/images')))
+        print("%-10s %12s %12s %8s %8s" % ("Backend", "Smoothing s", "Detection s", "Plates", "Recall"))
+        for name in sorted(results, key=lambda item: results[item]['smoothing']):
+            print("%-10s %12.3f %12.3f %8d %8.3f" % (name, results[name]['smoothing'], results[name]['detection'],
+                                                     results[name]['plates'], results[name]['recall']))
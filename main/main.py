@@ -1,94 +1,263 @@
 import cv2
+import numpy as np
 import sys
 import time
 
-from detector import ThresholdBlurDetector, MorphologyTransformDetector, CannyDetector
-from utils.loader import load_images, get_images_from_dir
-from utils.display import display_rectangles, show_image, multi_plot
-from utils.transform import deskew_lines, deskew_text
+from detector import AbstractDetector, ThresholdBlurDetector, MorphologyTransformDetector, CannyDetector
+from utils.loader import iter_images, get_images_from_dir
+from utils.display import display_rectangles, show_image, multi_plot, get_bounding_boxes
+from utils.image import calculate_sizes, box_iou
+from utils.transform import deskew_methods, deskew_frame, crop_plates
 from utils.segment import segment_contours
-from recognizer import TextRecognizer
+from utils.preprocess import PreprocessingContext
+from utils.visualization import TraceSink, set_sink
+from recognizer import TextRecognizer, BatchRecognizer, TemplateRecognizer
 
 
-def main(image_names=None, selected_detectors=None):
+def fuse_plates(plates, overlap_threshold=0.3):
+    """
+    Group the plates found more than once, by one or more detectors, ordering the crops of each plate by preference
+
+    When the rectangle of a crop holds the rectangle of another crop of the same plate, like the outline of a plate
+    holds its inner border, the inner crop comes first. Otherwise the crop whose rectangle aspect ratio is closest
+    to the one of a license plate does. The other crops are kept, since the preferred one may give fewer characters.
+
+    :type plates: list[(numpy.array, numpy.array)]
+    :param plates: Plate image and rectangle tuples, as returned by the detectors
+    :type overlap_threshold: float
+    :param overlap_threshold: Optional intersection over union above which two rectangles are the same plate
+    :rtype: list[list[(numpy.array, numpy.array)]]
+    :return: The plate image and rectangle tuples of every plate, best first.
+        The plates are in the order they were first given
+    """
+
+    if len(plates) < 2:
+        return [[plate] for plate in plates]
+
+    rectangles = [np.reshape(rectangle, (-1, 2)) for plate, rectangle in plates]
+    widths, heights = calculate_sizes([rectangle[:4] for rectangle in rectangles])
+
+    # Rectangles without an area score the worst, but still take part in the merging
+    ratios = np.maximum(widths, heights) / np.maximum(np.minimum(widths, heights), 1e-6)
+    scores = -np.abs(np.log(np.maximum(ratios, 1e-6) / AbstractDetector.plate_aspect))
+
+    # Group every plate with the best scoring one it overlaps, like non maximum suppression drops it
+    boxes = get_bounding_boxes(rectangles)
+    order = np.argsort(-scores, kind="mergesort")
+    groups = []
+    while len(order) > 0:
+        overlapping = box_iou(boxes[order[0]], boxes[order]) > overlap_threshold
+        overlapping[0] = True
+        groups.append(order[overlapping])
+        order = order[~overlapping]
+
+    ret = []
+    for group in sorted(groups, key=min):
+        # Count the other rectangles of the plate holding every rectangle, allowing for a pixel of error
+        group_boxes = boxes[group]
+        holding = np.sum((group_boxes[:, None, :2] >= group_boxes[None, :, :2] - 1).all(axis=2) &
+                         (group_boxes[:, None, 2:] <= group_boxes[None, :, 2:] + 1).all(axis=2), axis=1) - 1
+        preference = np.lexsort((-scores[group], -holding))
+        ret.append([plates[i] for i in group[preference]])
+    return ret
+
+
+def segment_plate(candidates, deskew='text', frame=None, scale=None):
+    """
+    Deskew and segment every crop of a plate, keeping the one giving the most characters
+
+    Segmenting is cheap next to recognizing the characters, which is done only for the kept crop.
+
+    :type candidates: list[(numpy.array, numpy.array)]
+    :param candidates: Plate image and rectangle tuples of the same plate, best first, as grouped by fuse_plates.
+        The first of the crops giving the most characters is kept
+    :type deskew: str
+    :param deskew: Optional name of the skew correction, one of utils.transform.deskew_methods
+    :type frame: numpy.array | None
+    :param frame: Optional grayscale image the plates were found in, to sample the deskewed plates from at once
+    :type scale: float | None
+    :param scale: Optional scale of the plates sampled from the frame, relative to the given plates.
+        Default zooms the plates smaller than 4500 pixels two times, like the detectors do
+    :rtype: (numpy.array, numpy.array, list[numpy.array])
+    :return: Deskewed plate image, plate rectangle and the character boxes of the kept crop
+    """
+
+    best = None
+    for plate, rectangle in candidates:
+        if __debug__:
+            show_image(plate, resize=False)
+
+        # CAUTION: The following methods require the plate to have black background and white characters
+
+        # Skew correction, using contours by default. The skew found on the plate is applied to the image,
+        # unless the detector returned a plate that isn't a crop of its rectangle
+        img = None
+        if frame is not None:
+            plate_scale = scale if scale is not None else (2.0 if plate.size < 4500 else 1.0)
+            img = deskew_frame(frame, plate, rectangle, deskew, plate_scale)
+        if img is None:
+            img = deskew_methods[deskew](plate)
+
+        # Cut the picture letter by letter
+        boxes = segment_contours(img)
+        if best is None or len(boxes) > len(best[2]):
+            best = img, rectangle, boxes
+    return best
+
+
+def process_image(src, label="", selected_detectors=None, batch_ocr=False, template_index=None,
+                  overlap_threshold=0.3, deskew='text', single_warp=False, scale=None):
+    """
+    Detect the license plates in an image and recognize their text
+
+    :type src: numpy.ndarray
+    :param src: Image to be processed
+    :type label: str
+    :param label: Optional label for the image
+    :type selected_detectors: list[type] | None
+    :param selected_detectors: Optional detector classes to use. Default is all of them
+    :type batch_ocr: bool
+    :param batch_ocr: Optional flag to recognize all characters of a plate at once instead of one by one
+    :type template_index: recognizer.TemplateIndex | None
+    :param template_index: Optional index of character glyphs to recognize the characters with instead of Tesseract
+    :type overlap_threshold: float | None
+    :param overlap_threshold: Optional intersection over union above which plates found by the detectors are
+        recognized only once, from the crop giving the most characters. None recognizes every found plate
+    :type deskew: str
+    :param deskew: Optional name of the skew correction, one of utils.transform.deskew_methods:
+        'text' (contours), 'lines' (line detection), 'moments' (image moments) or 'profile' (projection profiles)
+    :type single_warp: bool
+    :param single_warp: Optional flag to only find the plate rectangles with the detectors and sample every
+        deskewed plate from the image at once, instead of deskewing the plates cropped by the detectors.
+        The plates are then binarized with Otsu's threshold of the image instead of the binarization of the detectors
+    :type scale: float | None
+    :param scale: Optional scale of the plates sampled from the image with single_warp, for the recognition.
+        Default zooms the plates smaller than 4500 pixels two times, like the detectors do
+    :rtype: set[str]
+    :return: Text of the detected plates
+    """
+
+    # The detectors share the preprocessing steps of the image
+    context = PreprocessingContext(src)
+    if selected_detectors is None:
+        detectors = [
+            ThresholdBlurDetector(src, label, context),
+            CannyDetector(src, label, context),
+            MorphologyTransformDetector(src, label, context)
+        ]
+    else:
+        detectors = [detector(src, label, context) for detector in selected_detectors]
+
+    plates = []
+    for detector in detectors:
+        if single_warp:
+            # The plates are sampled from the image once their skew is known, so the detectors don't crop them
+            detector_plates = crop_plates(context.gray(), detector.find_rectangles())
+        else:
+            detector_plates = detector.find_plates()
+        if __debug__:
+            display_rectangles(src, [detector_plates[i][1] for i in range(len(detector_plates))])
+        plates.extend(detector_plates)
+
+    # The same plate is often found by more than one detector, recognize it only once
+    if overlap_threshold is not None:
+        plate_groups = fuse_plates(plates, overlap_threshold)
+        if __debug__:
+            display_rectangles(src, [candidates[0][1] for candidates in plate_groups])
+    else:
+        plate_groups = [[plate] for plate in plates]
+
+    plates_text = set([])
+    for candidates in plate_groups:
+        # Every crop of the plate is segmented, but only the one giving the most characters is recognized
+        img, original_rectangle, boxes = segment_plate(candidates, deskew, context.gray() if single_warp else None,
+                                                       scale)
+
+        ########################################
+        # Any detected character (box) modification should be done here
+        ########################################
+        for idx in range(len(boxes)):
+            # Inverts the character image so it has a white background and black character
+            boxes[idx] = cv2.bitwise_not(boxes[idx])
+
+        if template_index is not None:
+            # Match every box against the template index, using Tesseract only when unsure
+            results = TemplateRecognizer(boxes, template_index).find_boxes_text()
+        elif batch_ocr:
+            # Recognize every box of the plate with a single recognition
+            results = BatchRecognizer(boxes).find_boxes_text()
+        else:
+            # Detect text with confidence level, box by box
+            results = [TextRecognizer(box).find_text() for box in boxes]
+
+        labels = []
+        plate_text = ""
+        for result in results:
+            text, conf = result.text.strip(), result.confidence
+
+            # Cleaning the text of invalid values
+            box_character = ""
+            for idx in range(len(text)):
+                if ord(text[idx]) in range(128):
+                    box_character += text[idx]
+            # Add a label to the list
+            box_label = box_character + ", " + str(conf)
+            labels.append(box_label)
+            plate_text += box_character
+            # show_image(box, image_label=box_label, resize=False)
+
+        # Add the detected plate text to the set for the current image
+        if plate_text.strip() != "":
+            plates_text.add(plate_text.strip())
+
+        # Display each box with a label above it
+        if __debug__ and len(boxes) > 0:
+            bxs = multi_plot(250, 1000, 1, len(boxes), boxes, labels)
+            show_image(bxs, image_title="Confidence levels", resize=False)
+
+    return plates_text
+
+
+def main(image_names=None, selected_detectors=None, batch_ocr=False, template_index=None, trace_dir=None,
+         deskew='text', frames=None):
     """
     Load images from a directory and process them to extract the license plate numbers
+
+    :type image_names: list[str] | None
+    :param image_names: Optional paths of the images. Default is every JPG image in main/images
+    :type selected_detectors: list[type] | None
+    :param selected_detectors: Optional detector classes to use. Default is all of them
+    :type batch_ocr: bool
+    :param batch_ocr: Optional flag to recognize all characters of a plate at once instead of one by one
+    :type template_index: recognizer.TemplateIndex | None
+    :param template_index: Optional index of character glyphs to recognize the characters with instead of Tesseract
+    :type trace_dir: str | None
+    :param trace_dir: Optional directory to write the visualizations of the deskewing and segmentation steps to,
+        instead of showing them in windows
+    :type deskew: str
+    :param deskew: Optional name of the skew correction, one of utils.transform.deskew_methods
+    :type frames: collections.Iterable[(str, numpy.array)] | None
+    :param frames: Optional labels and images to process instead of the image files, like a utils.video.VideoSource
     """
 
+    if trace_dir is not None:
+        set_sink(TraceSink(trace_dir))
+
     start_time = time.clock()
     print('OpenCV version: %s' % cv2.__version__)
 
-    if image_names is None:
-        image_names = sorted(get_images_from_dir('main/images'))
-    if __debug__:
-        print(image_names)
-    images = load_images(image_names)
-
-    for i, src in enumerate(images):
-        if selected_detectors is None:
-            detectors = [
-                ThresholdBlurDetector(src, image_names[i]),
-                CannyDetector(src, image_names[i]),
-                MorphologyTransformDetector(src, image_names[i])
-            ]
-        else:
-            detectors = [detector(src, image_names[i]) for detector in selected_detectors]
-
-        plates_text = set([])
-        for detector in detectors:
-            plates = detector.find_plates()
-            if __debug__:
-                display_rectangles(src, [plates[i][1] for i in range(len(plates))])
-
-            for plate, original_rectangle in plates:
-                if __debug__:
-                    show_image(plate, resize=False)
-
-                # CAUTION: The following methods require the plate to have black background and white characters
-
-                # Skew correction using lines detection
-                # img = deskew_lines(plate)
-
-                # Skew correction using contours
-                img = deskew_text(plate)
-
-                # Cut the picture letter by letter
-                boxes = segment_contours(img)
-
-                ########################################
-                # Any detected character (box) modification should be done here
-                ########################################
-                for idx in range(len(boxes)):
-                    # Inverts the character image so it has a white background and black character
-                    boxes[idx] = cv2.bitwise_not(boxes[idx])
-
-                labels = []
-                plate_text = ""
-                for box in boxes:
-                    # Initialize Tesseract for this image
-                    tr = TextRecognizer(box)
-                    text, conf = tr.find_text()  # Detect text with confidence level
-                    text = text.strip()
-
-                    # Cleaning the text of invalid values
-                    box_character = ""
-                    for idx in range(len(text)):
-                        if ord(text[idx]) in range(128):
-                            box_character += text[idx]
-                    # Add a label to the list
-                    box_label = box_character + ", " + str(conf)
-                    labels.append(box_label)
-                    plate_text += box_character
-                    # show_image(box, image_label=box_label, resize=False)
-
-                # Add the detected plate text to the set for the current image
-                if plate_text.strip() != "":
-                    plates_text.add(plate_text.strip())
-
-                # Display each box with a label above it
-                if __debug__ and len(boxes) > 0:
-                    bxs = multi_plot(250, 1000, 1, len(boxes), boxes, labels)
-                    show_image(bxs, image_title="Confidence levels", resize=False)
+    if frames is None:
+        if image_names is None:
+            image_names = sorted(get_images_from_dir('main/images'))
+        if __debug__:
+            print(image_names)
+
+        # Images are loaded one at a time, shortly before they are processed
+        frames = iter_images(image_names)
+
+    for image_name, src in frames:
+        plates_text = process_image(src, image_name, selected_detectors, batch_ocr, template_index,
+                                    deskew=deskew)
 
         print("Detected plates in this picture:")
         for detected_text in plates_text:
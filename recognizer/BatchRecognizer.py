@@ -0,0 +1,83 @@
+import bisect
+import numpy as np
+
+from recognizer import TextRecognizer, RecognitionResult
+
+
+class BatchRecognizer(TextRecognizer):
+    """
+    Utilizes the Tesseract engine to perform OCR on every character box of a plate in a single recognition
+    """
+
+    def __init__(self, boxes, pool=None, spacing=20):
+        """
+        Initialize the recognizer with the character boxes of a plate
+
+        The boxes are placed left to right on a single white strip, separated by the specified spacing
+
+        :type boxes: list[numpy.ndarray]
+        :param boxes: BGR images of the characters, with white background and black characters
+        :type pool: recognizer.EnginePool | None
+        :param pool: Optional pool of engines to use. Default is the pool shared by the current process
+        :type spacing: int
+        :param spacing: Optional horizontal space between two boxes on the strip
+        """
+
+        self.box_count = len(boxes)
+        strip, self.box_starts = self._compose(boxes, spacing)
+        super(BatchRecognizer, self).__init__(strip, pool)
+
+    @staticmethod
+    def _compose(boxes, spacing):
+        """
+        Place the boxes on a white strip
+
+        :type boxes: list[numpy.ndarray]
+        :param boxes: BGR images of the characters
+        :type spacing: int
+        :param spacing: Horizontal space between two boxes
+        :rtype: (numpy.ndarray, list[int])
+        :return: The strip and the x-coordinate at which every box starts
+        """
+
+        strip_height = max([box.shape[0] for box in boxes]) if len(boxes) > 0 else 1
+        strip_width = sum([box.shape[1] for box in boxes]) + spacing * max(len(boxes) - 1, 0)
+        strip = np.empty((strip_height, max(strip_width, 1), 3), np.uint8)
+        strip[:, :] = (255, 255, 255)
+
+        starts = []
+        x = 0
+        for box in boxes:
+            box_height, box_width = box.shape[:2]
+            y = (strip_height - box_height) / 2  # Center the box vertically
+            strip[y:y + box_height, x:x + box_width] = box
+            starts.append(x)
+            x += box_width + spacing
+        return strip, starts
+
+    def find_boxes_text(self):
+        """
+        Find the text of every box with a single recognition of the strip
+
+        Every recognized character is assigned to the box in which its bounding box is centered
+
+        :rtype: list[recognizer.RecognitionResult]
+        :return: Detected text of every box, in the order of the boxes given, with confidence levels
+        """
+
+        box_symbols = [[] for i in range(self.box_count)]
+        if self.box_count > 0:
+            result = self.find_text(symbols=True)
+            for symbol in result.symbols:
+                left, top, right, bottom = symbol.box
+                # Strip coordinates of the center of the character
+                center = (left + right) / 2.0 - self.border
+                idx = bisect.bisect_right(self.box_starts, center) - 1
+                box_symbols[max(idx, 0)].append(symbol)
+
+        ret = []
+        for symbols in box_symbols:
+            text = "".join([symbol.text for symbol in symbols])
+            conf = sum([symbol.confidence for symbol in symbols]) / len(symbols) if len(symbols) > 0 else 0
+            ret.append(RecognitionResult(text, conf, symbols))
+        return ret
@@ -0,0 +1,93 @@
+import os
+import threading
+from contextlib import contextmanager
+from Queue import Queue
+
+import tesseract
+
+
+class EnginePool(object):
+    """
+    Pool of initialized Tesseract engines that are reused between recognitions
+    """
+
+    def __init__(self, size=1, tessdata=".", language="eng",
+                 whitelist="0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ", page_seg_mode=tesseract.PSM_SINGLE_BLOCK):
+        """
+        Initialize and configure the engines of the pool
+
+        :type size: int
+        :param size: Number of engines, i.e. how many recognitions can run at the same time
+        :type tessdata: str
+        :param tessdata: Optional parent folder of the tessdata folder
+        :type language: str
+        :param language: Optional language of the engines
+        :type whitelist: str
+        :param whitelist: Optional characters the engines are allowed to recognize
+        :type page_seg_mode: int
+        :param page_seg_mode: Optional page segmentation mode of the engines
+        """
+
+        self.size = size
+        self._engines = []
+        self._available = Queue()
+
+        for i in range(size):
+            # Loading the tessdata is the expensive part, so it is done only once per engine
+            api = tesseract.TessBaseAPI()
+            api.Init(tessdata, language, tesseract.OEM_DEFAULT)
+            api.SetVariable("tessedit_char_whitelist", whitelist)
+            api.SetPageSegMode(page_seg_mode)
+
+            self._engines.append(api)
+            self._available.put(api)
+
+    @contextmanager
+    def engine(self):
+        """
+        Check out an engine for the duration of a with block, waiting until one is available
+
+        :rtype: tesseract.TessBaseAPI
+        :return: A configured engine. It is cleared and returned to the pool when the block ends
+        """
+
+        api = self._available.get()
+        try:
+            yield api
+        finally:
+            api.Clear()
+            self._available.put(api)
+
+    def close(self):
+        """
+        Release the resources of every engine in the pool. The pool must not be used afterwards
+        """
+
+        for api in self._engines:
+            api.End()
+        self._engines = []
+
+
+_default_pool = None
+_default_pool_pid = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool(size=1):
+    """
+    Get the engine pool shared by the current process, creating it on first use
+
+    :type size: int
+    :param size: Number of engines, used only when the pool is created
+    :rtype: EnginePool
+    :return: The engine pool of the current process
+    """
+
+    global _default_pool, _default_pool_pid
+
+    with _default_pool_lock:
+        # A pool inherited from the parent process is not usable by a forked worker
+        if _default_pool is None or _default_pool_pid != os.getpid():
+            _default_pool = EnginePool(size)
+            _default_pool_pid = os.getpid()
+        return _default_pool
@@ -0,0 +1,14 @@
+from collections import namedtuple
+
+# Result of recognizing an image
+#   text: Detected text
+#   confidence: Mean confidence level of the text, from 0 to 100
+#   symbols: List of SymbolResult for every recognized character, or None when not requested
+RecognitionResult = namedtuple('RecognitionResult', ['text', 'confidence', 'symbols'])
+
+# A single recognized character
+#   text: The character
+#   confidence: Confidence level of the character, from 0 to 100
+#   box: Optional (left, top, right, bottom) bounding box of the character in the recognized image
+SymbolResult = namedtuple('SymbolResult', ['text', 'confidence', 'box'])
+SymbolResult.__new__.__defaults__ = (None,)
\ No newline at end of file
@@ -0,0 +1,129 @@
+import cv2
+import numpy as np
+
+
+class TemplateIndex(object):
+    """
+    Index of normalized character glyphs used to classify characters by their nearest neighbours
+    """
+
+    # Size (width, height) to which every glyph is normalized
+    glyph_size = (16, 24)
+
+    def __init__(self, features, labels):
+        """
+        Initialize the index with normalized glyphs and their labels
+
+        :type features: numpy.ndarray
+        :param features: Glyphs normalized by TemplateIndex.normalize, one per row
+        :type labels: list[str]
+        :param labels: Character of every glyph
+        :raises: ValueError if the number of labels is not equal with the number of glyphs
+        """
+
+        if len(features) != len(labels):
+            raise ValueError("The number of labels is different from the number of glyphs")
+        self.features = np.asarray(features, np.float32)
+        self.labels = np.asarray(labels)
+        self._squared_norms = (self.features ** 2).sum(axis=1)
+
+    @classmethod
+    def normalize(cls, boxes):
+        """
+        Normalize character images to zero mean, unit length feature vectors of the same size
+
+        :type boxes: list[numpy.ndarray]
+        :param boxes: BGR or gray images of the characters, with white background and black characters
+        :rtype: numpy.ndarray
+        :return: One feature vector per row
+        """
+
+        glyph_width, glyph_height = cls.glyph_size
+        ret = np.empty((len(boxes), glyph_width * glyph_height), np.float32)
+        for i, box in enumerate(boxes):
+            gray = cv2.cvtColor(box, cv2.COLOR_BGR2GRAY) if len(box.shape) == 3 else box
+            glyph = cv2.resize(gray, cls.glyph_size, interpolation=cv2.INTER_AREA)
+            ret[i] = 255 - glyph.ravel()
+
+        ret -= ret.mean(axis=1)[:, np.newaxis]
+        norms = np.sqrt((ret ** 2).sum(axis=1))
+        norms[norms == 0] = 1
+        return ret / norms[:, np.newaxis]
+
+    @classmethod
+    def train(cls, boxes, labels):
+        """
+        Build an index from labelled character images
+
+        :type boxes: list[numpy.ndarray]
+        :param boxes: BGR or gray images of the characters, with white background and black characters
+        :type labels: list[str]
+        :param labels: Character in every image
+        :rtype: TemplateIndex
+        :return: The index
+        """
+
+        return cls(cls.normalize(boxes), labels)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load an index saved with TemplateIndex.save
+
+        :type path: str
+        :param path: Path of the index file
+        :rtype: TemplateIndex
+        :return: The loaded index
+        """
+
+        data = np.load(path)
+        return cls(data['features'], data['labels'])
+
+    def save(self, path):
+        """
+        Save the index to a file
+
+        :type path: str
+        :param path: Path of the index file
+        """
+
+        np.savez(path, features=self.features, labels=self.labels)
+
+    def classify(self, boxes, k=3):
+        """
+        Classify character images by a vote of their k nearest glyphs in the index
+
+        :type boxes: list[numpy.ndarray]
+        :param boxes: BGR or gray images of the characters, with white background and black characters
+        :type k: int
+        :param k: Optional number of neighbours that vote
+        :rtype: list[(str, float)]
+        :return: Character and confidence level, from 0 to 100, for every image
+        """
+
+        if len(boxes) == 0 or len(self.labels) == 0:
+            return [("", 0.0) for box in boxes]
+
+        queries = self.normalize(boxes)
+
+        # Squared euclidean distances between every query and every glyph, |q|^2 - 2qg + |g|^2
+        distances = (queries ** 2).sum(axis=1)[:, np.newaxis] - 2 * queries.dot(self.features.T) + self._squared_norms
+        np.maximum(distances, 0, distances)
+
+        k = min(k, len(self.labels))
+        nearest = np.argsort(distances, axis=1)[:, :k]
+        nearest_distances = np.sqrt(distances[np.arange(len(queries))[:, np.newaxis], nearest])
+        nearest_labels = self.labels[nearest]
+
+        ret = []
+        for labels, dists in zip(nearest_labels, nearest_distances):
+            # Closer neighbours get a bigger vote
+            votes = 1.0 / (dists + 1e-6)
+            candidates = list(set(labels))
+            scores = [votes[labels == candidate].sum() for candidate in candidates]
+            best = int(np.argmax(scores))
+
+            # Unit vectors are at most 2 apart: an identical glyph gives 1, an opposite one 0
+            similarity = 1 - dists[labels == candidates[best]].min() / 2
+            ret.append((str(candidates[best]), 100.0 * similarity * scores[best] / votes.sum()))
+        return ret
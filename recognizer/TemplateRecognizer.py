@@ -0,0 +1,46 @@
+from recognizer import TextRecognizer, RecognitionResult, SymbolResult
+from utils import loader
+
+
+class TemplateRecognizer(object):
+    """
+    Recognizes the characters of a plate by matching them against a template index, using Tesseract when unsure
+    """
+
+    def __init__(self, boxes, index, fallback_threshold=50, pool=None):
+        """
+        Initialize the recognizer with the character boxes of a plate
+
+        :type boxes: list[numpy.ndarray]
+        :param boxes: BGR images of the characters, with white background and black characters
+        :type index: recognizer.TemplateIndex
+        :param index: Index of the glyphs to match against
+        :type fallback_threshold: float | None
+        :param fallback_threshold: Optional confidence level below which Tesseract is used instead.
+            None never uses Tesseract
+        :type pool: recognizer.EnginePool | None
+        :param pool: Optional pool of engines used by the fallback. Default is the pool shared by the current process
+        """
+
+        self.boxes = [loader.load_image(box, read_only=True) for box in boxes]
+        self.index = index
+        self.fallback_threshold = fallback_threshold
+        self.pool = pool
+
+    def find_boxes_text(self):
+        """
+        Find the character in every box, classifying all boxes with a single query of the index
+
+        :rtype: list[recognizer.RecognitionResult]
+        :return: Detected character with confidence level, for every box in order
+        """
+
+        ret = []
+        for box, (text, conf) in zip(self.boxes, self.index.classify(self.boxes)):
+            if self.fallback_threshold is not None and conf < self.fallback_threshold:
+                if __debug__:
+                    print("Template match %r (%.3f) below threshold, using Tesseract" % (text, conf))
+                ret.append(TextRecognizer(box, self.pool).find_text())
+            else:
+                ret.append(RecognitionResult(text, conf, [SymbolResult(text, conf)]))
+        return ret
@@ -1,6 +1,7 @@
 import cv2
 import tesseract
 
+from recognizer import get_default_pool, RecognitionResult, SymbolResult
 from utils import loader
 
 
@@ -9,55 +10,83 @@ class TextRecognizer(object):
     Utilizes the Tesseract engine to perform OCR on an image
     """
 
-    def __init__(self, image):
-        self.image = loader.load_image(image)
+    # Width of the white border added around the image before OCR
+    border = 20
 
-    def find_text(self):
+    def __init__(self, image, pool=None):
+        """
+        Initialize the recognizer with an image
+
+        :type image: numpy.ndarray
+        :param image: Image on which to perform OCR
+        :type pool: recognizer.EnginePool | None
+        :param pool: Optional pool of engines to use. Default is the pool shared by the current process
+        """
+
+        self.image = loader.load_image(image, read_only=True)
+        self.pool = pool if pool is not None else get_default_pool()
+
+    def find_text(self, symbols=False, cross_check=False):
         """
         Find text in an image
 
-        :rtype: (str, int)
+        :type symbols: bool
+        :param symbols: Optional flag to also collect the confidence level of every recognized character
+        :type cross_check: bool
+        :param cross_check: Optional flag to recognize a copy of the image a second time and compare the results
+        :rtype: recognizer.RecognitionResult
         :return: Detected text with confidence level
         """
 
         image0 = self.image
 
         # Thicken the border in order to make Tesseract feel happy to OCR the image
-        offset = 20
-        height, width, channel = image0.shape
-
+        offset = self.border
         image1 = cv2.copyMakeBorder(image0, offset, offset, offset, offset, cv2.BORDER_CONSTANT, value=(255, 255, 255))
 
-        # Initialize Tesseract with tessdata in the current folder
-        api = tesseract.TessBaseAPI()
-        api.Init(".", "eng", tesseract.OEM_DEFAULT)
-
-        # Allow only the specified characters
-        api.SetVariable("tessedit_char_whitelist", "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
-
-        # Assume a single uniform block of text
-        api.SetPageSegMode(tesseract.PSM_SINGLE_BLOCK)
-
-        height1, width1, channel1 = image1.shape
-        width_step = width * image1.dtype.itemsize
-
-        # Method 1
-        iplimage = cv2.cv.CreateImageHeader((width1, height1), cv2.cv.IPL_DEPTH_8U, channel1)
-        cv2.cv.SetData(iplimage, image1.tostring(), image1.dtype.itemsize * channel1 * width1)
-        tesseract.SetCvImage(iplimage, api)
-        text = api.GetUTF8Text()
-        conf = api.MeanTextConf()
-
-        # Method 2:
-        cvmat_image = cv2.cv.fromarray(image1)
-        iplimage = cv2.cv.GetImage(cvmat_image)
+        # Check out an engine that is already initialized and configured
+        with self.pool.engine() as api:
+            # The image header shares the numpy buffer, no copy of the pixels is made
+            iplimage = cv2.cv.GetImage(cv2.cv.fromarray(image1))
+            tesseract.SetCvImage(iplimage, api)
+            result = RecognitionResult(api.GetUTF8Text(), api.MeanTextConf(),
+                                       self._symbols(api) if symbols else None)
+
+            if cross_check:
+                # Recognize the image once more through a copy of its data
+                height1, width1, channel1 = image1.shape
+                iplimage = cv2.cv.CreateImageHeader((width1, height1), cv2.cv.IPL_DEPTH_8U, channel1)
+                cv2.cv.SetData(iplimage, image1.tostring(), image1.dtype.itemsize * channel1 * width1)
+                tesseract.SetCvImage(iplimage, api)
+                text2, conf2 = api.GetUTF8Text(), api.MeanTextConf()
+
+                # Keep the more confident of the two readings
+                if text2 != result.text:
+                    if __debug__:
+                        print("Cross check mismatch: %r (%d) vs %r (%d)" % (
+                            result.text, result.confidence, text2, conf2))
+                    if conf2 > result.confidence:
+                        result = RecognitionResult(text2, conf2, self._symbols(api) if symbols else None)
+
+        return result
+
+    @staticmethod
+    def _symbols(api):
+        """
+        Collect the recognized characters of the last recognition of an engine
 
-        tesseract.SetCvImage(iplimage, api)
-        text2 = api.GetUTF8Text()
-        conf2 = api.MeanTextConf()
+        :type api: tesseract.TessBaseAPI
+        :param api: Engine on which the recognition was run
+        :rtype: list[recognizer.SymbolResult]
+        :return: Every recognized character with its confidence level and bounding box
+        """
 
-        api.End()
-        if text == text2:
-            return text, conf
-        else:
-            return (text, conf), (text2, conf2)
+        ret = []
+        level = tesseract.RIL_SYMBOL
+        iterator = api.GetIterator()
+        while iterator:
+            ret.append(SymbolResult(iterator.GetUTF8Text(level), iterator.Confidence(level),
+                                    iterator.BoundingBox(level)))
+            if not iterator.Next(level):
+                break
+        return ret
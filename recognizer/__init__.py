@@ -1,2 +1,7 @@
 __author__ = 'robert'
-from TextRecognizer import TextRecognizer
\ No newline at end of file
+from RecognitionResult import RecognitionResult, SymbolResult
+from EnginePool import EnginePool, get_default_pool
+from TextRecognizer import TextRecognizer
+from BatchRecognizer import BatchRecognizer
+from TemplateIndex import TemplateIndex
+from TemplateRecognizer import TemplateRecognizer
\ No newline at end of file
@@ -1,6 +1,10 @@
 __author__ = 'robert'
 from display import display_rectangles
-from loader import get_images_from_dir, load_images, load_image
-from image import hq2x_zoom, calculate_size
-from transform import deskew_lines, deskew_text
-from segment import segment_contours
\ No newline at end of file
+from loader import get_images_from_dir, load_images, iter_images, iter_prefetched, load_image
+from image import hq2x_zoom, calculate_size, calculate_sizes, box_iou, non_max_suppression
+from transform import deskew_lines, deskew_text, deskew_moments, deskew_profile, deskew_frame, crop_plates
+from segment import segment_contours
+from smoothing import smooth, smoothing_backends
+from preprocess import PreprocessingContext
+from visualization import WindowSink, TraceSink, get_sink, set_sink
+from video import VideoSource
\ No newline at end of file
@@ -132,7 +132,32 @@ def draw_contours(image, contours, image_label="", color=(0, 255, 0)):
     show_image(src, image_label, 'Contours')
 
 
-def get_parts_of_image(img, rectangles):
+def get_bounding_boxes(rectangles, img_shape=None):
+    """
+    Calculates the upright bounding boxes of all rectangles at once
+
+    :type rectangles: list[numpy.array] | numpy.array
+    :param rectangles: Rectangles with the same number of points, either (4, 2) or (4, 1, 2) arrays,
+        or a single (N, 4, 2) array
+    :type img_shape: tuple | None
+    :param img_shape: Optional shape of an image to whose bounds the boxes are clipped
+    :rtype: numpy.array
+    :return: (N, 4) array of x_min, y_min, x_max, y_max of every rectangle
+    """
+
+    if len(rectangles) == 0:
+        return np.zeros((0, 4), np.int32)
+
+    points = np.array([np.reshape(rect, (-1, 2)) for rect in rectangles])
+    boxes = np.hstack((points.min(axis=1), points.max(axis=1))).astype(np.int32)
+    if img_shape is not None:
+        img_height, img_width = img_shape[:2]
+        np.clip(boxes[:, 0::2], 0, img_width, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0, img_height, out=boxes[:, 1::2])
+    return boxes
+
+
+def get_parts_of_image(img, rectangles, rotated=False):
     """
     Crops the detected rectangles from the image and tries to find any text
 
@@ -140,32 +165,82 @@ def get_parts_of_image(img, rectangles):
     :param img: Source image from which to crop
     :type rectangles: list[numpy.array]
     :param rectangles: Rectangles representing crop areas
+    :type rotated: bool
+    :param rotated: Optional flag to warp every rectangle to an upright image instead of
+        cropping its upright bounding box
     :rtype: list[numpy.array]
-    :return: Images representing the cropped areas
+    :return: Images representing the cropped areas. Without the rotated flag these are views of the source image
     """
 
-    ret = []
-    for rect in rectangles:
-        x_min = 999999
-        x_max = 0
-        y_min = 999999
-        y_max = 0
-        for point in rect:
-            if len(point.shape) == 1:
-                x_max = max(x_max, point[0])
-                y_max = max(y_max, point[1])
-                x_min = min(x_min, point[0])
-                y_min = min(y_min, point[1])
-            else:
-                x_max = max(x_max, point[0][0])
-                y_max = max(y_max, point[0][1])
-                x_min = min(x_min, point[0][0])
-                y_min = min(y_min, point[0][1])
-
-        # Get the part of the image
-        image_part = img[y_min:y_max, x_min:x_max]
-        ret.append(image_part)
-    return ret
+    if rotated:
+        return [warp_rectangle(img, rect) for rect in rectangles]
+
+    return [img[y_min:y_max, x_min:x_max] for x_min, y_min, x_max, y_max in get_bounding_boxes(rectangles, img.shape)]
+
+
+def crop_transform(rectangle, plate_shape, img_shape):
+    """
+    Finds the transformation from the image to a plate cropped from the upright bounding box of its rectangle,
+    possibly zoomed two times by hq2x
+
+    :type rectangle: numpy.array
+    :param rectangle: Rectangle the plate was cropped from
+    :type plate_shape: tuple
+    :param plate_shape: Shape of the plate image
+    :type img_shape: tuple
+    :param img_shape: Shape of the source image
+    :rtype: numpy.array | None
+    :return: 3x3 matrix transforming the image to the plate,
+        None when the plate is not such a crop of the bounding box
+    """
+
+    x_min, y_min, x_max, y_max = get_bounding_boxes([rectangle], img_shape)[0]
+    box_width, box_height = x_max - x_min, y_max - y_min
+    plate_height, plate_width = plate_shape[:2]
+    if box_width <= 0 or box_height <= 0 or plate_width % box_width != 0:
+        return None
+
+    zoom = plate_width // box_width
+    if zoom not in (1, 2) or plate_height != zoom * box_height:
+        return None
+
+    # Pixel centers of the zoomed plate fall between the pixel centers of the image
+    return np.array([[zoom, 0, zoom * (0.5 - x_min) - 0.5],
+                     [0, zoom, zoom * (0.5 - y_min) - 0.5],
+                     [0, 0, 1]], np.float64)
+
+
+def warp_rectangle(img, rectangle):
+    """
+    Warps a possibly rotated rectangle of the image to an upright image
+
+    :type img: numpy.array
+    :param img: Source image
+    :type rectangle: numpy.array
+    :param rectangle: Four corners of the rectangle, in order around the rectangle
+    :rtype: numpy.array
+    :return: The upright image of the rectangle
+    """
+
+    points = np.asarray(rectangle, np.float32).reshape(4, 2)
+
+    # The corners are already in cyclic order, make them clockwise on screen (y points down)
+    # and start from the corner with the smallest x + y
+    first, second, third = points[0], points[1], points[2]
+    cross = (second[0] - first[0]) * (third[1] - second[1]) - (second[1] - first[1]) * (third[0] - second[0])
+    if cross < 0:
+        points = points[::-1]
+    corners = np.roll(points, -int(np.argmin(points.sum(axis=1))), axis=0)
+    top_left, top_right, bottom_right, bottom_left = corners
+
+    width = int(round(max(np.linalg.norm(top_right - top_left), np.linalg.norm(bottom_right - bottom_left))))
+    height = int(round(max(np.linalg.norm(bottom_left - top_left), np.linalg.norm(bottom_right - top_right))))
+    if width == 0 or height == 0:
+        return img[0:0, 0:0]
+
+    dest_points = np.array([(0, 0), (width - 1, 0), (width - 1, height - 1), (0, height - 1)], np.float32)
+    trans_matrix = cv2.getPerspectiveTransform(corners, dest_points)
+    return cv2.warpPerspective(img, trans_matrix, (width, height))
 
 
 def get_white_pixels(img, rectangles):
@@ -198,19 +273,13 @@ def color_filter(img):
     :return: processed image in grayscale format
     """
 
+    # A pixel is kept when it is dark and its channels are close to each other
+    channel_min = img.min(axis=2).astype(np.int32)
+    channel_max = img.max(axis=2).astype(np.int32)
+    gray_pixels = np.logical_and(channel_max - channel_min <= 40, channel_max < 160)
+
     res = img.copy()
-    width, height, channel = img.shape
-    mask = np.zeros((width, height))
-
-    for i in range(width):
-        for j in range(height):
-            pixel = img[i, j]
-            minn = min(pixel)
-            maxx = max(pixel)
-            if (maxx - minn) <= 40 and maxx < 160:
-                mask[i, j] = 1
-            else:
-                res[i, j] = 255
+    res[np.logical_not(gray_pixels)] = 255
 
     res = cv2.cvtColor(res, cv2.COLOR_BGR2GRAY)
     return res
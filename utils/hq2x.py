@@ -1,5 +1,11 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
 from PIL import Image
 
+import hq2x_rules
+
 # Constants for indicating coordinates in a pixel's context
 TOP_LEFT = 0
 TOP = 1
@@ -26,7 +32,65 @@ Y_THRESHHOLD = 48
 U_THRESHHOLD = 7
 V_THRESHHOLD = 6
 
-rgb_yuv_cache = {}  # memoization
+
+class LRUCache(object):
+    """A memoization dict holding at most maxsize entries, dropping the least
+    recently used ones first.  It is safe to share between threads, and
+    counts its hits and misses.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """Returns the value cached for key, calling compute(key) and caching
+        the result if there is none.
+        """
+
+        with self._lock:
+            if key in self._entries:
+                # Move the entry to the most recently used end
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        # Computed outside the lock; two threads missing the same key at once
+        # both compute it, which is harmless
+        value = compute(key)
+
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        """Returns a dict with the hits, misses, current size and maximum
+        size of the cache.
+        """
+
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Memoization of rgb_to_yuv.  Plates hold a handful of colors, so a small
+# cache catches nearly all lookups while keeping memory flat on long runs
+rgb_yuv_cache = LRUCache(maxsize=4096)
 
 
 def rgb_to_yuv(rgb):
@@ -37,8 +101,11 @@ def rgb_to_yuv(rgb):
     match any other algorithm I can find, but whatever.
     """
 
-    if rgb in rgb_yuv_cache:
-        return rgb_yuv_cache[rgb]
+    return rgb_yuv_cache.get(tuple(rgb), compute_yuv)
+
+
+def compute_yuv(rgb):
+    """The uncached rgb_to_yuv."""
 
     r, g, b = rgb
 
@@ -46,7 +113,6 @@ def rgb_to_yuv(rgb):
     u = 128 + ((r - b) >> 2)
     v = 128 + ((-r + g * 2 - b) >> 3)
 
-    rgb_yuv_cache[rgb] = y, u, v
     return y, u, v
 
 
@@ -107,1428 +173,166 @@ def hq2x(source):
     Image object containing the upscaled image.
     """
 
-    w, h = source.size
-    mode = source.mode  # XXX use this for the target I guess somehow; palette?
     source = source.convert('RGB')
-    dest = Image.new('RGB', (w * 2, h * 2))
-
-    # These give direct pixel access via grid[x, y]
-    sourcegrid = source.load()
-    destgrid = dest.load()
-
-    # Wrap sourcegrid in a function to cap the coordinates; we need a 3x3 array
-    # centered on the current pixel, and factoring out the capping is simpler
-    # than a ton of ifs
-    def get_px(x, y):
-        if x < 0:
-            x = 0
-        elif x >= w:
-            x = w - 1
-
-        if y < 0:
-            y = 0
-        elif y >= h:
-            y = h - 1
-
-        return sourcegrid[x, y]
-
-    for x in xrange(w):
-        for y in xrange(h):
-            # This is a flattened 3x3 grid with the current pixel in the
-            # middle; if the pixel is on an edge, the row/column in the void is
-            # just a copy of the edge
-            context = [
-                get_px(x - 1, y - 1), get_px(x, y - 1), get_px(x + 1, y - 1),
-                get_px(x - 1, y), get_px(x, y), get_px(x + 1, y),
-                get_px(x - 1, y + 1), get_px(x, y + 1), get_px(x + 1, y + 1),
-            ]
-
-            tl, tr, bl, br = hq2x_pixel(context)
-
-            destgrid[x * 2, y * 2] = tl
-            destgrid[x * 2 + 1, y * 2] = tr
-            destgrid[x * 2, y * 2 + 1] = bl
-            destgrid[x * 2 + 1, y * 2 + 1] = br
-
-    return dest
-
-
-def hq2x_pixel(context):
+    return Image.fromarray(hq2x_array(np.asarray(source)), 'RGB')
+
+
+def hq2x_array(source):
+    """Upscales an RGB image held in a (height, width, 3) array using the hq2x
+    algorithm.  Returns a (height * 2, width * 2, 3) uint8 array.
+
+    This gives the same pixels as running hq2x_pixel on every pixel, but the
+    whole image is handled at once, see hq2x_padded.
+    """
+
+    # Repeating the edge rows/columns is the same capping get_px used to do
+    padded = np.pad(np.asarray(source, dtype=np.int32), ((1, 1), (1, 1), (0, 0)), mode='edge')
+    return hq2x_padded(padded, rgb_to_yuv_array(padded), yuv_differ)
+
+
+def hq2x_gray_array(source, binary=False):
+    """Upscales a grayscale image held in a (height, width) array using the
+    hq2x algorithm.  Returns a (height * 2, width * 2) uint8 array.
+
+    The result is the same as running hq2x_array on the image converted to
+    RGB and taking any channel of the output, without the three channels.
+    A gray pixel has U and V of 128, so only Y = 3 * gray / 4 is compared.
+    If binary is set, the image must only hold 0 and 255, as thresholded
+    plates do; those two differ in Y, so plain inequality is used instead.
+    """
+
+    padded = np.pad(np.asarray(source, dtype=np.int32), 1, mode='edge')
+    if binary:
+        return hq2x_padded(padded, padded, np.not_equal)
+    return hq2x_padded(padded, (padded * 3) >> 2, y_differ)
+
+
+def hq2x_padded(padded, yuv_padded, differ):
+    """Upscales an edge-padded image held in a (height + 2, width + 2, ...)
+    int32 array.  yuv_padded holds the colors that are compared, with the
+    same padding, and differ(a, b) tells which of them are different.
+    Returns a (height * 2, width * 2, ...) uint8 array.
+
+    The 3x3 contexts are shifted views of the padded image, the pattern of
+    every pixel is computed in one go and the rules of every pixel are looked
+    up in rule_table and applied as masked array operations.
+    """
+
+    h, w = padded.shape[0] - 2, padded.shape[1] - 2
+    pixel_shape = padded.shape[2:]
+    context = [padded[i // 3:i // 3 + h, i % 3:i % 3 + w] for i in xrange(9)]
+    yuv_context = [yuv_padded[i // 3:i // 3 + h, i % 3:i % 3 + w] for i in xrange(9)]
+
+    pattern = np.zeros((h, w), dtype=np.int32)
+    for bit in xrange(9):
+        if bit != CENTER:
+            pattern[differ(yuv_context[bit], yuv_context[CENTER])] |= context_flag[bit]
+
+    # Flatten everything to columns of pixels and look up the rules of every
+    # pixel's pattern in the rule table
+    context = np.array(context).reshape((9, h * w) + pixel_shape)
+    yuv_context = np.array(yuv_context).reshape((9, h * w) + yuv_padded.shape[2:])
+    pixels = np.arange(h * w)
+    rules = rule_table[pattern.ravel()]
+
+    # dest[dy, dx, y, x] is the output pixel (x * 2 + dx, y * 2 + dy)
+    dest = np.empty((2, 2, h, w) + pixel_shape, dtype=np.uint8)
+    corners = dest.reshape((4, h * w) + pixel_shape)
+    for corner in xrange(4):
+        rule = rules[:, corner].astype(np.intp)
+        different = differ(yuv_context[rule[:, 0], pixels], yuv_context[rule[:, 1], pixels])
+        kernel, first, second = np.where(different, rule[:, 5:8].T, rule[:, 2:5].T)
+        wc, w1, w2, shift = kernel_weights[kernel].T.reshape((4, h * w) + (1,) * len(pixel_shape))
+        corners[corner] = (context[CENTER] * wc + context[first, pixels] * w1 +
+                           context[second, pixels] * w2) >> shift
+
+    axes = (2, 0, 3, 1) + tuple(xrange(4, dest.ndim))
+    return dest.transpose(axes).reshape((h * 2, w * 2) + pixel_shape)
+
+
+def rgb_to_yuv_array(rgb):
+    """Array version of rgb_to_yuv: takes an (..., 3) integer array of RGB
+    colors and returns an (..., 3) int32 array of YUV colors.
+    """
+
+    rgb = np.asarray(rgb, dtype=np.int32)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+
+    yuv = np.empty(rgb.shape, dtype=np.int32)
+    yuv[..., 0] = (r + g + b) >> 2
+    yuv[..., 1] = 128 + ((r - b) >> 2)
+    yuv[..., 2] = 128 + ((-r + g * 2 - b) >> 3)
+    return yuv
+
+
+def yuv_differ(a, b):
+    """Array version of "not yuv_equal(a, b)" for (..., 3) arrays of YUV
+    colors.  Returns a boolean array.
+    """
+
+    diff = np.abs(a - b)
+    return (diff[..., 0] > Y_THRESHHOLD) | (diff[..., 1] > U_THRESHHOLD) | (diff[..., 2] > V_THRESHHOLD)
+
+
+def y_differ(a, b):
+    """Version of yuv_differ for arrays holding only the Y component, which is
+    all there is to compare between two gray colors.
+    """
+
+    return np.abs(a - b) > Y_THRESHHOLD
+
+
+# Interpolations used by the rule table.  Every one of them is applied to the
+# center pixel and up to two neighbours; the weights are those of the center
+# pixel and the two neighbours, followed by the power of two the weighted sum
+# is divided by.  All sums are non-negative, so shifting gives the same result
+# as the integer division in the interp functions
+interp_kernels = ('copy', 'interp1', 'interp2', 'interp5', 'interp6', 'interp7', 'interp9', 'interp10')
+interp_weights = (
+    (1, 0, 0, 0),
+    (3, 1, 0, 2),
+    (2, 1, 1, 2),
+    (1, 1, 0, 1),
+    (5, 2, 1, 3),
+    (6, 1, 1, 3),
+    (2, 3, 3, 3),
+    (14, 1, 1, 4),
+)
+kernel_weights = np.array(interp_weights, dtype=np.int32)
+
+
+def hq2x_pixel(context, table=None):
     """Applies the hq2x algorithm to a single pixel, given the 3x3 context
-    around it.  This is the gigantic switch() from the original source.
+    around it.  The rules for the pixel's pattern are read from rule_table,
+    or from the given table of the same layout.
 
     Returns the four corresponding pixels to be put in the new image: upper
     left, upper right, lower left, lower right.
     """
 
-    # The massive lookup table is keyed on a bitstring where each bit
-    # corresponds to an element in the context.  The top left is 0x1,
-    # top middle is 0x2, and so on across and down.  Bits turned on
-    # indicate a pixel different from the current pixel
     yuv_context = [rgb_to_yuv(rgb) for rgb in context]
-    yuv_px = rgb_to_yuv(context[CENTER])
+    yuv_px = yuv_context[CENTER]
 
     pattern = 0
     for bit in xrange(9):
         if bit != CENTER and not yuv_equal(yuv_context[bit], yuv_px):
             pattern = pattern | context_flag[bit]
 
-    if pattern in (0, 1, 4, 32, 128, 5, 132, 160, 33, 129, 36, 133, 164, 161, 37, 165):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (2, 34, 130, 162):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (16, 17, 48, 49):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (64, 65, 68, 69):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern in (8, 12, 136, 140):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (3, 35, 131, 163):
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (6, 38, 134, 166):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (20, 21, 52, 53):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (144, 145, 176, 177):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern in (192, 193, 196, 197):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern in (96, 97, 100, 101):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern in (40, 44, 168, 172):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (9, 13, 137, 141):
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (18, 50):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (80, 81):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (72, 76):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern in (10, 138):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 66:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 24:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (7, 39, 135):
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (148, 149, 180):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern in (224, 228, 225):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern in (41, 169, 45):
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (22, 54):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (208, 209):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (104, 108):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern in (11, 139):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (19, 51):
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tl = interp1(context[CENTER], context[LEFT])
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tl = interp6(context[CENTER], context[TOP], context[LEFT])
-            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (146, 178):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-            br = interp1(context[CENTER], context[BOTTOM])
-        else:
-            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
-            br = interp6(context[CENTER], context[RIGHT], context[BOTTOM])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-    elif pattern in (84, 85):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            tr = interp1(context[CENTER], context[TOP])
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            tr = interp6(context[CENTER], context[RIGHT], context[TOP])
-            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-    elif pattern in (112, 113):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            bl = interp1(context[CENTER], context[LEFT])
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            bl = interp6(context[CENTER], context[BOTTOM], context[LEFT])
-            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (200, 204):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-            br = interp1(context[CENTER], context[RIGHT])
-        else:
-            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
-            br = interp6(context[CENTER], context[BOTTOM], context[RIGHT])
-    elif pattern in (73, 77):
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            tl = interp1(context[CENTER], context[TOP])
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            tl = interp6(context[CENTER], context[LEFT], context[TOP])
-            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern in (42, 170):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-            bl = interp1(context[CENTER], context[BOTTOM])
-        else:
-            tl = interp9(context[CENTER], context[LEFT], context[TOP])
-            bl = interp6(context[CENTER], context[LEFT], context[BOTTOM])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (14, 142):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-            tr = interp1(context[CENTER], context[RIGHT])
-        else:
-            tl = interp9(context[CENTER], context[LEFT], context[TOP])
-            tr = interp6(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 67:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 70:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 28:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 152:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 194:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 98:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 56:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 25:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (26, 31):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (82, 214):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (88, 248):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (74, 107):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 27:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 86:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 216:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 106:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 30:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 210:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 120:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 75:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 29:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 198:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 184:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 99:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 57:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 71:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 156:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 226:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 60:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 195:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 102:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 153:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 58:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 83:
-        tl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 92:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 202:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 78:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 154:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 114:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 89:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 90:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (55, 23):
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tl = interp1(context[CENTER], context[LEFT])
-            tr = context[CENTER]
-        else:
-            tl = interp6(context[CENTER], context[TOP], context[LEFT])
-            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern in (182, 150):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-            br = interp1(context[CENTER], context[BOTTOM])
-        else:
-            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
-            br = interp6(context[CENTER], context[RIGHT], context[BOTTOM])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-    elif pattern in (213, 212):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            tr = interp1(context[CENTER], context[TOP])
-            br = context[CENTER]
-        else:
-            tr = interp6(context[CENTER], context[RIGHT], context[TOP])
-            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-    elif pattern in (241, 240):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            bl = interp1(context[CENTER], context[LEFT])
-            br = context[CENTER]
-        else:
-            bl = interp6(context[CENTER], context[BOTTOM], context[LEFT])
-            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (236, 232):
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-            br = interp1(context[CENTER], context[RIGHT])
-        else:
-            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
-            br = interp6(context[CENTER], context[BOTTOM], context[RIGHT])
-    elif pattern in (109, 105):
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            tl = interp1(context[CENTER], context[TOP])
-            bl = context[CENTER]
-        else:
-            tl = interp6(context[CENTER], context[LEFT], context[TOP])
-            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern in (171, 43):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-            bl = interp1(context[CENTER], context[BOTTOM])
-        else:
-            tl = interp9(context[CENTER], context[LEFT], context[TOP])
-            bl = interp6(context[CENTER], context[LEFT], context[BOTTOM])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (143, 15):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-            tr = interp1(context[CENTER], context[RIGHT])
-        else:
-            tl = interp9(context[CENTER], context[LEFT], context[TOP])
-            tr = interp6(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 124:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 203:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 62:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 211:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 118:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 217:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 110:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 155:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 188:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 185:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 61:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 157:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 103:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 227:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 230:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 199:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 220:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 158:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 234:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 242:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 59:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 121:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 87:
-        tl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 79:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 122:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 94:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 218:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 91:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 229:
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 167:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 173:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 181:
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 186:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 115:
-        tl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 93:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 206:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern in (205, 201):
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        else:
-            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern in (174, 46):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = interp1(context[CENTER], context[TOP_LEFT])
-        else:
-            tl = interp7(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (179, 147):
-        tl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = interp1(context[CENTER], context[TOP_RIGHT])
-        else:
-            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern in (117, 116):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-        else:
-            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 189:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 231:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 126:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 219:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 125:
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            tl = interp1(context[CENTER], context[TOP])
-            bl = context[CENTER]
-        else:
-            tl = interp6(context[CENTER], context[LEFT], context[TOP])
-            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
-        tr = interp1(context[CENTER], context[TOP])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 221:
-        tl = interp1(context[CENTER], context[TOP])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            tr = interp1(context[CENTER], context[TOP])
-            br = context[CENTER]
-        else:
-            tr = interp6(context[CENTER], context[RIGHT], context[TOP])
-            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-    elif pattern == 207:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-            tr = interp1(context[CENTER], context[RIGHT])
-        else:
-            tl = interp9(context[CENTER], context[LEFT], context[TOP])
-            tr = interp6(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 238:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        tr = interp1(context[CENTER], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-            br = interp1(context[CENTER], context[RIGHT])
-        else:
-            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
-            br = interp6(context[CENTER], context[BOTTOM], context[RIGHT])
-    elif pattern == 190:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-            br = interp1(context[CENTER], context[BOTTOM])
-        else:
-            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
-            br = interp6(context[CENTER], context[RIGHT], context[BOTTOM])
-        bl = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 187:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-            bl = interp1(context[CENTER], context[BOTTOM])
-        else:
-            tl = interp9(context[CENTER], context[LEFT], context[TOP])
-            bl = interp6(context[CENTER], context[LEFT], context[BOTTOM])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 243:
-        tl = interp1(context[CENTER], context[LEFT])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            bl = interp1(context[CENTER], context[LEFT])
-            br = context[CENTER]
-        else:
-            bl = interp6(context[CENTER], context[BOTTOM], context[LEFT])
-            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 119:
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tl = interp1(context[CENTER], context[LEFT])
-            tr = context[CENTER]
-        else:
-            tl = interp6(context[CENTER], context[TOP], context[LEFT])
-            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern in (237, 233):
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern in (175, 47):
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp10(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern in (183, 151):
-        tl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern in (245, 244):
-        tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        bl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 250:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 123:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 95:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 222:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 252:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 249:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 235:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 111:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp10(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
-    elif pattern == 63:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp10(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
-    elif pattern == 159:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 215:
-        tl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 246:
-        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 254:
-        tl = interp1(context[CENTER], context[TOP_LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 253:
-        tl = interp1(context[CENTER], context[TOP])
-        tr = interp1(context[CENTER], context[TOP])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 251:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[TOP_RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 239:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp10(context[CENTER], context[LEFT], context[TOP])
-        tr = interp1(context[CENTER], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[RIGHT])
-    elif pattern == 127:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp10(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
-        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
-    elif pattern == 191:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp10(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM])
-        br = interp1(context[CENTER], context[BOTTOM])
-    elif pattern == 223:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp2(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 247:
-        tl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
-        bl = interp1(context[CENTER], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
-    elif pattern == 255:
-        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
-            tl = context[CENTER]
-        else:
-            tl = interp10(context[CENTER], context[LEFT], context[TOP])
-        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
-            tr = context[CENTER]
-        else:
-            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
-        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
-            bl = context[CENTER]
-        else:
-            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
-        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
-            br = context[CENTER]
-        else:
-            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
-
-    return tl, tr, bl, br
\ No newline at end of file
+    if table is None:
+        table = rule_table
+
+    pixels = []
+    for first, second, kernel, a, b, kernel_different, a_different, b_different in table[pattern].tolist():
+        if not yuv_equal(yuv_context[first], yuv_context[second]):
+            kernel, a, b = kernel_different, a_different, b_different
+
+        wc, wa, wb, shift = interp_weights[kernel]
+        pixels.append(tuple(
+            (c * wc + ca * wa + cb * wb) >> shift
+            for c, ca, cb in zip(context[CENTER], context[a], context[b])
+        ))
+
+    return tuple(pixels)
+
+
+rule_table = np.array(hq2x_rules.rule_table, dtype=np.uint8)
@@ -0,0 +1,1563 @@
+# Builds and checks the rule table of the hq2x module from hq2x_pixel_switch, the gigantic switch() from the
+# original source. Run "python utils/hq2x_build.py" to check the table shipped in hq2x_rules, and
+# "python utils/hq2x_build.py --generate" to regenerate it after changing the switch.
+import ast
+import inspect
+import random
+import textwrap
+
+import numpy as np
+
+
+from hq2x import TOP_LEFT, TOP, TOP_RIGHT, LEFT, CENTER, RIGHT, BOTTOM_LEFT, BOTTOM, BOTTOM_RIGHT
+from hq2x import context_flag, interp_kernels, rgb_to_yuv, yuv_equal, hq2x_pixel
+from hq2x import interp1, interp2, interp5, interp6, interp7, interp9, interp10
+
+
+def hq2x_pixel_switch(context):
+    """Applies the hq2x algorithm to a single pixel, given the 3x3 context
+    around it.  This is the gigantic switch() from the original source.
+
+    It is not used to upscale images: the rule table in hq2x_rules is
+    generated from it by write_rule_module, which checks the table against it
+    with check_rule_table.
+
+    Returns the four corresponding pixels to be put in the new image: upper
+    left, upper right, lower left, lower right.
+    """
+
+    # The massive lookup table is keyed on a bitstring where each bit
+    # corresponds to an element in the context.  The top left is 0x1,
+    # top middle is 0x2, and so on across and down.  Bits turned on
+    # indicate a pixel different from the current pixel
+    yuv_context = [rgb_to_yuv(rgb) for rgb in context]
+    yuv_px = rgb_to_yuv(context[CENTER])
+
+    pattern = 0
+    for bit in xrange(9):
+        if bit != CENTER and not yuv_equal(yuv_context[bit], yuv_px):
+            pattern = pattern | context_flag[bit]
+
+    if pattern in (0, 1, 4, 32, 128, 5, 132, 160, 33, 129, 36, 133, 164, 161, 37, 165):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (2, 34, 130, 162):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (16, 17, 48, 49):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (64, 65, 68, 69):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern in (8, 12, 136, 140):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (3, 35, 131, 163):
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (6, 38, 134, 166):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (20, 21, 52, 53):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (144, 145, 176, 177):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern in (192, 193, 196, 197):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern in (96, 97, 100, 101):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern in (40, 44, 168, 172):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (9, 13, 137, 141):
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (18, 50):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (80, 81):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (72, 76):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern in (10, 138):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 66:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 24:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (7, 39, 135):
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (148, 149, 180):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern in (224, 228, 225):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern in (41, 169, 45):
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (22, 54):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (208, 209):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (104, 108):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern in (11, 139):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (19, 51):
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tl = interp1(context[CENTER], context[LEFT])
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tl = interp6(context[CENTER], context[TOP], context[LEFT])
+            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (146, 178):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+            br = interp1(context[CENTER], context[BOTTOM])
+        else:
+            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
+            br = interp6(context[CENTER], context[RIGHT], context[BOTTOM])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+    elif pattern in (84, 85):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            tr = interp1(context[CENTER], context[TOP])
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            tr = interp6(context[CENTER], context[RIGHT], context[TOP])
+            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+    elif pattern in (112, 113):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            bl = interp1(context[CENTER], context[LEFT])
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            bl = interp6(context[CENTER], context[BOTTOM], context[LEFT])
+            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (200, 204):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+            br = interp1(context[CENTER], context[RIGHT])
+        else:
+            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
+            br = interp6(context[CENTER], context[BOTTOM], context[RIGHT])
+    elif pattern in (73, 77):
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            tl = interp1(context[CENTER], context[TOP])
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            tl = interp6(context[CENTER], context[LEFT], context[TOP])
+            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern in (42, 170):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+            bl = interp1(context[CENTER], context[BOTTOM])
+        else:
+            tl = interp9(context[CENTER], context[LEFT], context[TOP])
+            bl = interp6(context[CENTER], context[LEFT], context[BOTTOM])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (14, 142):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+            tr = interp1(context[CENTER], context[RIGHT])
+        else:
+            tl = interp9(context[CENTER], context[LEFT], context[TOP])
+            tr = interp6(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 67:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 70:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 28:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 152:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 194:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 98:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 56:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 25:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (26, 31):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (82, 214):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (88, 248):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (74, 107):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 27:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 86:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 216:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 106:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 30:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 210:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 120:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 75:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 29:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 198:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 184:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 99:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 57:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 71:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 156:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 226:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 60:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 195:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 102:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 153:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 58:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 83:
+        tl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 92:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 202:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 78:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 154:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 114:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 89:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 90:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (55, 23):
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tl = interp1(context[CENTER], context[LEFT])
+            tr = context[CENTER]
+        else:
+            tl = interp6(context[CENTER], context[TOP], context[LEFT])
+            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern in (182, 150):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+            br = interp1(context[CENTER], context[BOTTOM])
+        else:
+            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
+            br = interp6(context[CENTER], context[RIGHT], context[BOTTOM])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+    elif pattern in (213, 212):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            tr = interp1(context[CENTER], context[TOP])
+            br = context[CENTER]
+        else:
+            tr = interp6(context[CENTER], context[RIGHT], context[TOP])
+            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+    elif pattern in (241, 240):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            bl = interp1(context[CENTER], context[LEFT])
+            br = context[CENTER]
+        else:
+            bl = interp6(context[CENTER], context[BOTTOM], context[LEFT])
+            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (236, 232):
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+            br = interp1(context[CENTER], context[RIGHT])
+        else:
+            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
+            br = interp6(context[CENTER], context[BOTTOM], context[RIGHT])
+    elif pattern in (109, 105):
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            tl = interp1(context[CENTER], context[TOP])
+            bl = context[CENTER]
+        else:
+            tl = interp6(context[CENTER], context[LEFT], context[TOP])
+            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern in (171, 43):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+            bl = interp1(context[CENTER], context[BOTTOM])
+        else:
+            tl = interp9(context[CENTER], context[LEFT], context[TOP])
+            bl = interp6(context[CENTER], context[LEFT], context[BOTTOM])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (143, 15):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+            tr = interp1(context[CENTER], context[RIGHT])
+        else:
+            tl = interp9(context[CENTER], context[LEFT], context[TOP])
+            tr = interp6(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 124:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 203:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 62:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 211:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 118:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 217:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 110:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 155:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 188:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 185:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 61:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 157:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 103:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 227:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 230:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 199:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 220:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 158:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 234:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 242:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 59:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 121:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 87:
+        tl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 79:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 122:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 94:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 218:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 91:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 229:
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 167:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 173:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 181:
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 186:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 115:
+        tl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 93:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 206:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern in (205, 201):
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        else:
+            bl = interp7(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern in (174, 46):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = interp1(context[CENTER], context[TOP_LEFT])
+        else:
+            tl = interp7(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (179, 147):
+        tl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = interp1(context[CENTER], context[TOP_RIGHT])
+        else:
+            tr = interp7(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern in (117, 116):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+        else:
+            br = interp7(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 189:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 231:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 126:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 219:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 125:
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            tl = interp1(context[CENTER], context[TOP])
+            bl = context[CENTER]
+        else:
+            tl = interp6(context[CENTER], context[LEFT], context[TOP])
+            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
+        tr = interp1(context[CENTER], context[TOP])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 221:
+        tl = interp1(context[CENTER], context[TOP])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            tr = interp1(context[CENTER], context[TOP])
+            br = context[CENTER]
+        else:
+            tr = interp6(context[CENTER], context[RIGHT], context[TOP])
+            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+    elif pattern == 207:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+            tr = interp1(context[CENTER], context[RIGHT])
+        else:
+            tl = interp9(context[CENTER], context[LEFT], context[TOP])
+            tr = interp6(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 238:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        tr = interp1(context[CENTER], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+            br = interp1(context[CENTER], context[RIGHT])
+        else:
+            bl = interp9(context[CENTER], context[BOTTOM], context[LEFT])
+            br = interp6(context[CENTER], context[BOTTOM], context[RIGHT])
+    elif pattern == 190:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+            br = interp1(context[CENTER], context[BOTTOM])
+        else:
+            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
+            br = interp6(context[CENTER], context[RIGHT], context[BOTTOM])
+        bl = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 187:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+            bl = interp1(context[CENTER], context[BOTTOM])
+        else:
+            tl = interp9(context[CENTER], context[LEFT], context[TOP])
+            bl = interp6(context[CENTER], context[LEFT], context[BOTTOM])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 243:
+        tl = interp1(context[CENTER], context[LEFT])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            bl = interp1(context[CENTER], context[LEFT])
+            br = context[CENTER]
+        else:
+            bl = interp6(context[CENTER], context[BOTTOM], context[LEFT])
+            br = interp9(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 119:
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tl = interp1(context[CENTER], context[LEFT])
+            tr = context[CENTER]
+        else:
+            tl = interp6(context[CENTER], context[TOP], context[LEFT])
+            tr = interp9(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern in (237, 233):
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern in (175, 47):
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp10(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern in (183, 151):
+        tl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern in (245, 244):
+        tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        bl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 250:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 123:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 95:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 222:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 252:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 249:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 235:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp2(context[CENTER], context[TOP_RIGHT], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 111:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp10(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[RIGHT])
+    elif pattern == 63:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp10(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp2(context[CENTER], context[BOTTOM_RIGHT], context[BOTTOM])
+    elif pattern == 159:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 215:
+        tl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp2(context[CENTER], context[BOTTOM_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 246:
+        tl = interp2(context[CENTER], context[TOP_LEFT], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 254:
+        tl = interp1(context[CENTER], context[TOP_LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 253:
+        tl = interp1(context[CENTER], context[TOP])
+        tr = interp1(context[CENTER], context[TOP])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 251:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[TOP_RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 239:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp10(context[CENTER], context[LEFT], context[TOP])
+        tr = interp1(context[CENTER], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[RIGHT])
+    elif pattern == 127:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp10(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp2(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp2(context[CENTER], context[BOTTOM], context[LEFT])
+        br = interp1(context[CENTER], context[BOTTOM_RIGHT])
+    elif pattern == 191:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp10(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM])
+        br = interp1(context[CENTER], context[BOTTOM])
+    elif pattern == 223:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp2(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[BOTTOM_LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp2(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 247:
+        tl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
+        bl = interp1(context[CENTER], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
+    elif pattern == 255:
+        if not yuv_equal(yuv_context[LEFT], yuv_context[TOP]):
+            tl = context[CENTER]
+        else:
+            tl = interp10(context[CENTER], context[LEFT], context[TOP])
+        if not yuv_equal(yuv_context[TOP], yuv_context[RIGHT]):
+            tr = context[CENTER]
+        else:
+            tr = interp10(context[CENTER], context[TOP], context[RIGHT])
+        if not yuv_equal(yuv_context[BOTTOM], yuv_context[LEFT]):
+            bl = context[CENTER]
+        else:
+            bl = interp10(context[CENTER], context[BOTTOM], context[LEFT])
+        if not yuv_equal(yuv_context[RIGHT], yuv_context[BOTTOM]):
+            br = context[CENTER]
+        else:
+            br = interp10(context[CENTER], context[RIGHT], context[BOTTOM])
+
+    return tl, tr, bl, br
+
+
+def parse_branch_rules():
+    """Reads the rules of the gigantic switch in hq2x_pixel_switch.  Returns a
+    dict mapping each pattern to a tuple of four rules: upper left, upper
+    right, lower left, lower right.
+
+    Every assignment in the switch is either context[CENTER] or an interp
+    function whose first argument is context[CENTER]; they become a
+    (kernel, first neighbour, second neighbour) tuple.  Assignments guarded by
+    "if not yuv_equal(yuv_context[a], yuv_context[b])" become
+    ('cond', (a, b), rule if different, rule if equal).
+    """
+
+    def context_index(node):
+        return globals()[node.slice.value.id]
+
+    def pixel_rule(node):
+        if isinstance(node, ast.Subscript):
+            return 'copy', CENTER, CENTER
+        args = [context_index(arg) for arg in node.args[1:]]
+        if len(args) == 1:
+            args.append(CENTER)
+        return node.func.id, args[0], args[1]
+
+    source = textwrap.dedent(inspect.getsource(hq2x_pixel_switch))
+    branch = [node for node in ast.parse(source).body[0].body if isinstance(node, ast.If)][0]
+
+    rules = {}
+    while branch is not None:
+        comparator = branch.test.comparators[0]
+        if isinstance(comparator, ast.Tuple):
+            patterns = [element.n for element in comparator.elts]
+        else:
+            patterns = [comparator.n]
+
+        corners = {}
+        for statement in branch.body:
+            if isinstance(statement, ast.Assign):
+                corners[statement.targets[0].id] = pixel_rule(statement.value)
+            else:
+                # A single yuv_equal check may guard more than one corner
+                first, second = [context_index(arg) for arg in statement.test.operand.args]
+                if_equal = dict((assign.targets[0].id, assign.value) for assign in statement.orelse)
+                for assign in statement.body:
+                    corners[assign.targets[0].id] = (
+                        'cond', (first, second),
+                        pixel_rule(assign.value),
+                        pixel_rule(if_equal[assign.targets[0].id])
+                    )
+
+        for pattern in patterns:
+            rules[pattern] = (corners['tl'], corners['tr'], corners['bl'], corners['br'])
+        branch = branch.orelse[0] if branch.orelse else None
+
+    return rules
+
+
+def build_rule_table(rules):
+    """Compiles the rules returned by parse_branch_rules into a (256, 4, 8)
+    uint8 array, indexed by pattern and output pixel.  Each entry holds:
+
+        the two context cells of the yuv_equal check,
+        kernel and two neighbours to use when they are equal,
+        kernel and two neighbours to use when they are different.
+
+    Kernels are indices into interp_kernels.  Rules without a check use
+    (CENTER, CENTER), which are always equal.
+    """
+
+    def compile_rule(rule):
+        kernel, first, second = rule
+        return interp_kernels.index(kernel), first, second
+
+    table = np.zeros((256, 4, 8), dtype=np.uint8)
+    for pattern, corners in rules.items():
+        for corner, rule in enumerate(corners):
+            if rule[0] == 'cond':
+                (first, second), if_different, if_equal = rule[1:]
+            else:
+                first = second = CENTER
+                if_different = if_equal = rule
+            table[pattern, corner] = (first, second) + compile_rule(if_equal) + compile_rule(if_different)
+
+    return table
+
+
+def check_rule_table(table=None, trials=32, seed=0):
+    """Compares hq2x_pixel using the given rule table, by default the one
+    loaded from hq2x_rules, against hq2x_pixel_switch.  For every pattern,
+    builds random contexts that produce it, with the differing cells drawn
+    from a small palette so that the yuv_equal checks go both ways.
+
+    Returns a list of the patterns for which the two disagree.
+    """
+
+    rng = random.Random(seed)
+
+    def random_color():
+        return rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)
+
+    mismatches = []
+    for pattern in xrange(256):
+        for trial in xrange(trials):
+            center = random_color()
+            palette = []
+            palette_size = rng.randint(1, 3)
+            while len(palette) < palette_size:
+                color = random_color()
+                if not yuv_equal(rgb_to_yuv(color), rgb_to_yuv(center)):
+                    palette.append(color)
+
+            context = [rng.choice(palette) if bit != CENTER and pattern & context_flag[bit] else center
+                       for bit in xrange(9)]
+            if hq2x_pixel(context, table) != hq2x_pixel_switch(context):
+                mismatches.append(pattern)
+                break
+
+    return mismatches
+
+
+def write_rule_module(path):
+    """Regenerates the hq2x_rules module at the given path from the switch in
+    hq2x_pixel_switch.  Needs the source of this file, so it is run by hand
+    after changing the switch, never on import.
+
+    Raises ValueError without writing anything when the generated table
+    disagrees with the switch.
+    """
+
+    table = build_rule_table(parse_branch_rules())
+    failed = check_rule_table(table)
+    if failed:
+        raise ValueError("Rule table disagrees with hq2x_pixel_switch for patterns: %s" % failed)
+
+    lines = [
+        '# Generated by utils.hq2x_build.write_rule_module from hq2x_pixel_switch, do not edit.',
+        '# For every pattern and output pixel (upper left, upper right, lower left, lower right):',
+        '# the two context cells of the yuv_equal check, then kernel and two neighbours',
+        '# to use when they are equal, then kernel and two neighbours when they are different.',
+        'rule_table = (',
+    ]
+    for pattern in xrange(256):
+        corners = ', '.join('(%s)' % ', '.join(str(value) for value in corner) for corner in table[pattern].tolist())
+        lines.append('    (%s),  # 0x%02x' % (corners, pattern))
+    lines.append(')')
+
+    with open(path, 'w') as module:
+        module.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    import os
+    import sys
+
+    if sys.argv[1:] == ['--generate']:
+        write_rule_module(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hq2x_rules.py'))
+        print("Rule table generated, it matches hq2x_pixel_switch for all 256 patterns")
+    else:
+        failed = check_rule_table()
+        if failed:
+            print("Rule table disagrees with hq2x_pixel_switch for patterns: %s" % failed)
+            sys.exit(1)
+        print("Rule table matches hq2x_pixel_switch for all 256 patterns")
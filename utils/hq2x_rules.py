@@ -0,0 +1,262 @@
+# Generated by utils.hq2x_build.write_rule_module from hq2x_pixel_switch, do not edit.
+# For every pattern and output pixel (upper left, upper right, lower left, lower right):
+# the two context cells of the yuv_equal check, then kernel and two neighbours
+# to use when they are equal, then kernel and two neighbours when they are different.
+rule_table = (
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x00
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x01
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x02
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x03
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x04
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x05
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x06
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x07
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x08
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x09
+    ((3, 1, 2, 3, 1, 1, 0, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x0a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x0b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x0c
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x0d
+    ((3, 1, 6, 3, 1, 1, 0, 4), (3, 1, 4, 1, 5, 1, 5, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x0e
+    ((3, 1, 6, 3, 1, 0, 4, 4), (3, 1, 4, 1, 5, 1, 5, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x0f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x10
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x11
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x12
+    ((1, 5, 4, 1, 3, 1, 3, 4), (1, 5, 6, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x13
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x14
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x15
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x16
+    ((1, 5, 4, 1, 3, 1, 3, 4), (1, 5, 6, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x17
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x18
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x19
+    ((3, 1, 2, 3, 1, 0, 4, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x1a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 1, 2, 4, 1, 2, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x1b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x1c
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x1d
+    ((4, 4, 1, 0, 4, 1, 0, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x1e
+    ((3, 1, 2, 3, 1, 0, 4, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x1f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x20
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x21
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x22
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x23
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x24
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x25
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x26
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x27
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x28
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x29
+    ((3, 1, 6, 3, 1, 1, 0, 4), (4, 4, 2, 2, 5, 2, 2, 5), (3, 1, 4, 3, 7, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x2a
+    ((3, 1, 6, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (3, 1, 4, 3, 7, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x2b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x2c
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x2d
+    ((3, 1, 5, 3, 1, 1, 0, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x2e
+    ((3, 1, 7, 3, 1, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x2f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x30
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x31
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x32
+    ((1, 5, 4, 1, 3, 1, 3, 4), (1, 5, 6, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x33
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x34
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x35
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x36
+    ((1, 5, 4, 1, 3, 1, 3, 4), (1, 5, 6, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x37
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x38
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x39
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x3a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x3b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x3c
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x3d
+    ((4, 4, 1, 0, 4, 1, 0, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x3e
+    ((3, 1, 7, 3, 1, 0, 4, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 8, 7, 2, 8, 7)),  # 0x3f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x40
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x41
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x42
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x43
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x44
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x45
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x46
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x47
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 2, 7, 3, 1, 6, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x48
+    ((7, 3, 4, 3, 1, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 1, 6, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x49
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x4a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 1, 6, 4, 1, 6, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x4b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 2, 7, 3, 1, 6, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x4c
+    ((7, 3, 4, 3, 1, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 1, 6, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x4d
+    ((3, 1, 5, 3, 1, 1, 0, 4), (4, 4, 1, 5, 4, 1, 5, 4), (7, 3, 5, 7, 3, 1, 6, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x4e
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4), (7, 3, 5, 7, 3, 1, 6, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x4f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 1, 8, 4)),  # 0x50
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 1, 8, 4)),  # 0x51
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0x52
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x53
+    ((4, 4, 2, 3, 1, 2, 3, 1), (5, 7, 4, 5, 1, 1, 1, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 6, 5, 7, 1, 8, 4)),  # 0x54
+    ((4, 4, 2, 3, 1, 2, 3, 1), (5, 7, 4, 5, 1, 1, 1, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 6, 5, 7, 1, 8, 4)),  # 0x55
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x56
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x57
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (7, 3, 2, 7, 3, 0, 4, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0x58
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x59
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 5, 1, 5, 1, 2, 4), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x5a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (1, 5, 5, 1, 5, 1, 2, 4), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x5b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x5c
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 1, 4, 1, 1, 4), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x5d
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 2, 1, 5, 0, 4, 4), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x5e
+    ((3, 1, 2, 3, 1, 0, 4, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 1, 6, 4, 1, 6, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x5f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x60
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x61
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x62
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x63
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x64
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x65
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x66
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x67
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x68
+    ((7, 3, 4, 3, 1, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x69
+    ((4, 4, 1, 0, 4, 1, 0, 4), (4, 4, 2, 2, 5, 2, 2, 5), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x6a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x6b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x6c
+    ((7, 3, 4, 3, 1, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x6d
+    ((4, 4, 1, 0, 4, 1, 0, 4), (4, 4, 1, 5, 4, 1, 5, 4), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x6e
+    ((3, 1, 7, 3, 1, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 2, 8, 5, 2, 8, 5)),  # 0x6f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (5, 7, 4, 7, 3, 1, 3, 4), (5, 7, 6, 5, 7, 1, 8, 4)),  # 0x70
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (5, 7, 4, 7, 3, 1, 3, 4), (5, 7, 6, 5, 7, 1, 8, 4)),  # 0x71
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x72
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x73
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x74
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x75
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x76
+    ((1, 5, 4, 1, 3, 1, 3, 4), (1, 5, 6, 1, 5, 0, 4, 4), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x77
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x78
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (7, 3, 2, 7, 3, 0, 4, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x79
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 5, 1, 5, 1, 2, 4), (7, 3, 2, 7, 3, 0, 4, 4), (5, 7, 5, 5, 7, 1, 8, 4)),  # 0x7a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 1, 2, 4, 1, 2, 4), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x7b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x7c
+    ((7, 3, 4, 3, 1, 1, 1, 4), (4, 4, 1, 1, 4, 1, 1, 4), (7, 3, 6, 7, 3, 0, 4, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x7d
+    ((4, 4, 1, 0, 4, 1, 0, 4), (1, 5, 2, 1, 5, 0, 4, 4), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x7e
+    ((3, 1, 7, 3, 1, 0, 4, 4), (1, 5, 2, 1, 5, 0, 4, 4), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 1, 8, 4, 1, 8, 4)),  # 0x7f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x80
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x81
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x82
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x83
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x84
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x85
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x86
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x87
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x88
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x89
+    ((3, 1, 2, 3, 1, 1, 0, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x8a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x8b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x8c
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x8d
+    ((3, 1, 6, 3, 1, 1, 0, 4), (3, 1, 4, 1, 5, 1, 5, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x8e
+    ((3, 1, 6, 3, 1, 0, 4, 4), (3, 1, 4, 1, 5, 1, 5, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0x8f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x90
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x91
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 6, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (1, 5, 4, 5, 7, 1, 7, 4)),  # 0x92
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x93
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x94
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x95
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 6, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (1, 5, 4, 5, 7, 1, 7, 4)),  # 0x96
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 7, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x97
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x98
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x99
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x9a
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 1, 2, 4, 1, 2, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x9b
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x9c
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x9d
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x9e
+    ((3, 1, 2, 3, 1, 0, 4, 4), (1, 5, 7, 1, 5, 0, 4, 4), (4, 4, 2, 6, 7, 2, 6, 7), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0x9f
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa0
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa1
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa2
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa3
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa4
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa5
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa6
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa7
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa8
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xa9
+    ((3, 1, 6, 3, 1, 1, 0, 4), (4, 4, 2, 2, 5, 2, 2, 5), (3, 1, 4, 3, 7, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xaa
+    ((3, 1, 6, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (3, 1, 4, 3, 7, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xab
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xac
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xad
+    ((3, 1, 5, 3, 1, 1, 0, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xae
+    ((3, 1, 7, 3, 1, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 2, 5, 7, 2, 5, 7)),  # 0xaf
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb0
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb1
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 6, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (1, 5, 4, 5, 7, 1, 7, 4)),  # 0xb2
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb3
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb4
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb5
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 6, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (1, 5, 4, 5, 7, 1, 7, 4)),  # 0xb6
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 7, 1, 5, 0, 4, 4), (4, 4, 2, 7, 3, 2, 7, 3), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb7
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb8
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xb9
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xba
+    ((3, 1, 6, 3, 1, 0, 4, 4), (4, 4, 1, 2, 4, 1, 2, 4), (3, 1, 4, 3, 7, 1, 7, 4), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xbb
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xbc
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xbd
+    ((4, 4, 1, 0, 4, 1, 0, 4), (1, 5, 6, 1, 5, 0, 4, 4), (4, 4, 1, 7, 4, 1, 7, 4), (1, 5, 4, 5, 7, 1, 7, 4)),  # 0xbe
+    ((3, 1, 7, 3, 1, 0, 4, 4), (1, 5, 7, 1, 5, 0, 4, 4), (4, 4, 1, 7, 4, 1, 7, 4), (4, 4, 1, 7, 4, 1, 7, 4)),  # 0xbf
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc0
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc1
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc2
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc3
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc4
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc5
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc6
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 2, 6, 3, 2, 6, 3), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc7
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 1, 6, 4), (7, 3, 4, 7, 5, 1, 5, 4)),  # 0xc8
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 5, 7, 3, 1, 6, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xc9
+    ((3, 1, 5, 3, 1, 1, 0, 4), (4, 4, 2, 2, 5, 2, 2, 5), (7, 3, 5, 7, 3, 1, 6, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xca
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 1, 6, 4, 1, 6, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xcb
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 1, 6, 4), (7, 3, 4, 7, 5, 1, 5, 4)),  # 0xcc
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 5, 7, 3, 1, 6, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xcd
+    ((3, 1, 5, 3, 1, 1, 0, 4), (4, 4, 1, 5, 4, 1, 5, 4), (7, 3, 5, 7, 3, 1, 6, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xce
+    ((3, 1, 6, 3, 1, 0, 4, 4), (3, 1, 4, 1, 5, 1, 5, 4), (4, 4, 1, 6, 4, 1, 6, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xcf
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd0
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd1
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 2, 4, 1, 2, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd2
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 2, 4, 1, 2, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd3
+    ((4, 4, 2, 3, 1, 2, 3, 1), (5, 7, 4, 5, 1, 1, 1, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 6, 5, 7, 0, 4, 4)),  # 0xd4
+    ((4, 4, 2, 3, 1, 2, 3, 1), (5, 7, 4, 5, 1, 1, 1, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 6, 5, 7, 0, 4, 4)),  # 0xd5
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd6
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 7, 1, 5, 0, 4, 4), (4, 4, 2, 6, 3, 2, 6, 3), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd7
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 1, 6, 4, 1, 6, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd8
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (4, 4, 1, 6, 4, 1, 6, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xd9
+    ((3, 1, 5, 3, 1, 1, 0, 4), (1, 5, 5, 1, 5, 1, 2, 4), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xda
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 1, 2, 4, 1, 2, 4), (4, 4, 1, 6, 4, 1, 6, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xdb
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (7, 3, 5, 7, 3, 1, 6, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xdc
+    ((4, 4, 1, 1, 4, 1, 1, 4), (5, 7, 4, 5, 1, 1, 1, 4), (4, 4, 1, 6, 4, 1, 6, 4), (5, 7, 6, 5, 7, 0, 4, 4)),  # 0xdd
+    ((4, 4, 1, 0, 4, 1, 0, 4), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 1, 6, 4, 1, 6, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xde
+    ((3, 1, 2, 3, 1, 0, 4, 4), (1, 5, 7, 1, 5, 0, 4, 4), (4, 4, 1, 6, 4, 1, 6, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xdf
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe0
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe1
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe2
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 2, 2, 5, 2, 2, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe3
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe4
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 1, 5, 2, 1, 5), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe5
+    ((4, 4, 2, 0, 3, 2, 0, 3), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe6
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4), (4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe7
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 0, 4, 4), (7, 3, 4, 7, 5, 1, 5, 4)),  # 0xe8
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 7, 7, 3, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xe9
+    ((3, 1, 5, 3, 1, 1, 0, 4), (4, 4, 2, 2, 5, 2, 2, 5), (7, 3, 2, 7, 3, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xea
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 2, 2, 5, 2, 2, 5), (7, 3, 7, 7, 3, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xeb
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 6, 7, 3, 0, 4, 4), (7, 3, 4, 7, 5, 1, 5, 4)),  # 0xec
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 1, 5, 2, 1, 5), (7, 3, 7, 7, 3, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xed
+    ((4, 4, 1, 0, 4, 1, 0, 4), (4, 4, 1, 5, 4, 1, 5, 4), (7, 3, 6, 7, 3, 0, 4, 4), (7, 3, 4, 7, 5, 1, 5, 4)),  # 0xee
+    ((3, 1, 7, 3, 1, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4), (7, 3, 7, 7, 3, 0, 4, 4), (4, 4, 1, 5, 4, 1, 5, 4)),  # 0xef
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (5, 7, 4, 7, 3, 1, 3, 4), (5, 7, 6, 5, 7, 0, 4, 4)),  # 0xf0
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 2, 2, 1, 2, 2, 1), (5, 7, 4, 7, 3, 1, 3, 4), (5, 7, 6, 5, 7, 0, 4, 4)),  # 0xf1
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 5, 1, 5, 1, 2, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xf2
+    ((4, 4, 1, 3, 4, 1, 3, 4), (4, 4, 1, 2, 4, 1, 2, 4), (5, 7, 4, 7, 3, 1, 3, 4), (5, 7, 6, 5, 7, 0, 4, 4)),  # 0xf3
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xf4
+    ((4, 4, 2, 3, 1, 2, 3, 1), (4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xf5
+    ((4, 4, 2, 0, 3, 2, 0, 3), (1, 5, 2, 1, 5, 0, 4, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xf6
+    ((4, 4, 1, 3, 4, 1, 3, 4), (1, 5, 7, 1, 5, 0, 4, 4), (4, 4, 1, 3, 4, 1, 3, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xf7
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 2, 2, 1, 2, 2, 1), (7, 3, 2, 7, 3, 0, 4, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xf8
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 2, 2, 1, 2, 2, 1), (7, 3, 7, 7, 3, 0, 4, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xf9
+    ((4, 4, 1, 0, 4, 1, 0, 4), (4, 4, 1, 2, 4, 1, 2, 4), (7, 3, 2, 7, 3, 0, 4, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xfa
+    ((3, 1, 2, 3, 1, 0, 4, 4), (4, 4, 1, 2, 4, 1, 2, 4), (7, 3, 7, 7, 3, 0, 4, 4), (5, 7, 2, 5, 7, 0, 4, 4)),  # 0xfb
+    ((4, 4, 2, 0, 1, 2, 0, 1), (4, 4, 1, 1, 4, 1, 1, 4), (7, 3, 2, 7, 3, 0, 4, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xfc
+    ((4, 4, 1, 1, 4, 1, 1, 4), (4, 4, 1, 1, 4, 1, 1, 4), (7, 3, 7, 7, 3, 0, 4, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xfd
+    ((4, 4, 1, 0, 4, 1, 0, 4), (1, 5, 2, 1, 5, 0, 4, 4), (7, 3, 2, 7, 3, 0, 4, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xfe
+    ((3, 1, 7, 3, 1, 0, 4, 4), (1, 5, 7, 1, 5, 0, 4, 4), (7, 3, 7, 7, 3, 0, 4, 4), (5, 7, 7, 5, 7, 0, 4, 4)),  # 0xff
+)
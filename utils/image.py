@@ -1,23 +1,24 @@
 import math
 import numpy as np
 
-from PIL import Image
-from hq2x import hq2x
+from hq2x import hq2x_array, hq2x_gray_array
 
 
-def hq2x_zoom(source_image):
+def hq2x_zoom(source_image, binary=False):
     """
     Performs a 2x zoom on a picture using the hqx algorithm
 
     :type source_image: numpy.array
-    :param source_image: An image to be zoomed
+    :param source_image: An image to be zoomed, either grayscale or with three channels
+    :type binary: bool
+    :param binary: Optional flag telling that a grayscale image only holds black and white pixels
     :rtype: np.array
-    :return: The zoomed picture
+    :return: The zoomed picture, with the same channels as the source image
     """
 
-    source = Image.fromarray(source_image)
-    dest = hq2x(source)
-    return np.array(dest)
+    if len(source_image.shape) == 2:
+        return hq2x_gray_array(source_image, binary)
+    return hq2x_array(source_image)
 
 
 def calculate_size(points):
@@ -54,3 +55,94 @@ def calculate_size(points):
         width = max(width, math.hypot(points[1][0] - points[3][0], points[1][1] - points[3][1]))
 
     return width, height
+
+
+def calculate_sizes(rectangles):
+    """
+    Calculates width and height of many rectangles at once, the same way as calculate_size
+
+    :type rectangles: numpy.array
+    :param rectangles: (N, 4, 2) or (N, 4, 1, 2) array of the (x, y) coordinates of four points per rectangle
+    :rtype: (numpy.array, numpy.array)
+    :return: The widths and the heights of the rectangles
+    """
+
+    points = np.asarray(rectangles, np.float64).reshape(-1, 4, 2)
+
+    # Sort points of every rectangle by their x-coordinate, then their y-coordinate
+    order = np.lexsort((points[:, :, 1], points[:, :, 0]), axis=-1)
+    points = points[np.arange(len(points))[:, np.newaxis], order]
+    x, y = points[:, :, 0], points[:, :, 1]
+
+    def distance(i, j):
+        return np.hypot(x[:, i] - x[:, j], y[:, i] - y[:, j])
+
+    height = np.maximum(distance(0, 1), distance(2, 3))
+
+    # Pair each of the two left points with the right point closer in height
+    width1 = np.where(np.abs(y[:, 0] - y[:, 2]) < np.abs(y[:, 0] - y[:, 3]), distance(0, 2), distance(0, 3))
+    width2 = np.where(np.abs(y[:, 1] - y[:, 2]) < np.abs(y[:, 1] - y[:, 3]), distance(1, 2), distance(1, 3))
+    width = np.maximum(width1, width2)
+
+    return width, height
+
+
+def box_areas(boxes):
+    """
+    Calculates the areas of upright bounding boxes
+
+    :type boxes: numpy.array
+    :param boxes: (N, 4) array of x_min, y_min, x_max, y_max of every box
+    :rtype: numpy.array
+    :return: The areas of the boxes
+    """
+
+    boxes = np.asarray(boxes, np.float64).reshape(-1, 4)
+    return np.maximum(boxes[:, 2] - boxes[:, 0], 0) * np.maximum(boxes[:, 3] - boxes[:, 1], 0)
+
+
+def box_iou(box, boxes):
+    """
+    Calculates the intersection over union of one upright bounding box with many others
+
+    :type box: numpy.array
+    :param box: x_min, y_min, x_max, y_max of a box
+    :type boxes: numpy.array
+    :param boxes: (N, 4) array of x_min, y_min, x_max, y_max of the other boxes
+    :rtype: numpy.array
+    :return: The intersection over union with every box, 0 for boxes without area
+    """
+
+    boxes = np.asarray(boxes, np.float64).reshape(-1, 4)
+    width = np.minimum(boxes[:, 2], box[2]) - np.maximum(boxes[:, 0], box[0])
+    height = np.minimum(boxes[:, 3], box[3]) - np.maximum(boxes[:, 1], box[1])
+    intersection = np.maximum(width, 0) * np.maximum(height, 0)
+
+    union = box_areas(box)[0] + box_areas(boxes) - intersection
+    return intersection / np.where(union > 0, union, 1.0)
+
+
+def non_max_suppression(boxes, scores, threshold=0.3):
+    """
+    Greedily keeps the best scoring boxes, dropping every box overlapping an already kept one
+
+    :type boxes: numpy.array
+    :param boxes: (N, 4) array of x_min, y_min, x_max, y_max of every box
+    :type scores: list[float] | numpy.array
+    :param scores: Score of every box, higher is better
+    :type threshold: float
+    :param threshold: Optional intersection over union above which two boxes are taken to be the same object
+    :rtype: list[int]
+    :return: Indices of the kept boxes, best scoring first
+    """
+
+    boxes = np.asarray(boxes, np.float64).reshape(-1, 4)
+
+    # Stable sort, so boxes with equal scores are kept in their original order
+    order = np.argsort(-np.asarray(scores, np.float64), kind="mergesort")
+    keep = []
+    while len(order) > 0:
+        best = order[0]
+        keep.append(int(best))
+        order = order[1:][box_iou(boxes[best], boxes[order[1:]]) <= threshold]
+    return keep
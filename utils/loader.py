@@ -1,4 +1,8 @@
 import os
+import sys
+import threading
+from Queue import Queue, Empty, Full
+
 import cv2
 import numpy as np
 
@@ -37,20 +41,137 @@ def load_images(filenames):
     return ret
 
 
-def load_image(image):
+def iter_prefetched(iterable, size, drop_when_full=False, on_drop=None, name="prefetch"):
+    """
+    Iterate over an iterable on a background thread, reading items ahead of the consumer
+
+    The reading stops when the consumer does. An exception raised by the iterable is raised again in the consumer,
+    after the items read before it.
+
+    :type iterable: collections.Iterable
+    :param iterable: Items to read. A generator is closed when the reading stops
+    :type size: int
+    :param size: Number of items read ahead, at least 1
+    :type drop_when_full: bool
+    :param drop_when_full: Optional flag to drop the oldest item read ahead for the new one when the consumer is
+        behind, instead of waiting for it
+    :type on_drop: function | None
+    :param on_drop: Optional function called with every dropped item
+    :type name: str
+    :param name: Optional name of the reader thread
+    :rtype: collections.Iterable
+    :return: The items of the iterable, in order
+    """
+
+    end = object()  # Marks the end of the items, or a failure of the reader
+    items = Queue(maxsize=size)
+    stopped = threading.Event()
+    failure = []
+
+    def put(item):
+        if drop_when_full:
+            # Make room by dropping the oldest item, the consumer is behind
+            while True:
+                try:
+                    items.put_nowait(item)
+                    return True
+                except Full:
+                    try:
+                        dropped = items.get_nowait()
+                    except Empty:
+                        continue
+                    if on_drop is not None:
+                        on_drop(dropped)
+
+        # Wait for space in the queue, unless the consumer is gone
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def read():
+        iterator = None
+        try:
+            iterator = iter(iterable)
+            for item in iterator:
+                if not put(item) or stopped.is_set():
+                    return
+        except Exception:
+            failure.append(sys.exc_info())
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+        put(end)
+
+    reader = threading.Thread(target=read, name=name)
+    reader.daemon = True
+    reader.start()
+
+    try:
+        while True:
+            item = items.get()
+            if item is end:
+                break
+            yield item
+        if failure:
+            exc_type, exc_value, exc_traceback = failure[0]
+            raise exc_type, exc_value, exc_traceback
+    finally:
+        stopped.set()
+
+
+def iter_images(filenames, prefetch=4):
+    """
+    Lazily load images represented by an array of filenames
+
+    The images are read ahead on a background thread, but never more than the prefetch count,
+    so memory use does not depend on the number of filenames
+
+    :type filenames: collections.Iterable[str]
+    :param filenames: Filenames of the images
+    :type prefetch: int
+    :param prefetch: Optional number of images read ahead. With 0 every image is read when requested
+    :rtype: collections.Iterable[(str, numpy.array)]
+    :return: The filename and loaded image of every file, in order
+    """
+
+    if prefetch <= 0:
+        for fn in filenames:
+            yield fn, cv2.imread(fn)
+        return
+
+    images = iter_prefetched(((fn, cv2.imread(fn)) for fn in filenames), prefetch, name="image-reader")
+    try:
+        for item in images:
+            yield item
+    finally:
+        images.close()
+
+
+def load_image(image, read_only=False):
     """
     Loads or copies an image depending on the parameter
 
     :type image: str | numpy.array
     :param image: Object from which to create an image
+    :type read_only: bool
+    :param read_only: Optional flag to return a read-only view of an array instead of a copy.
+        The caller must then copy any buffer it modifies
     :rtype: numpy.array
     :return: The loaded picture
     :raises: ValueError if image type is not str or numpy.array
     """
 
     if type(image) == str:
-        return load_images(image)[0]
+        return load_images([image])[0]
     elif type(image) == np.ndarray:
+        if read_only:
+            view = image.view()
+            view.flags.writeable = False
+            return view
         return image.copy()
     else:
         raise ValueError("Incorrect variable type")
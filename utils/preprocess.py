@@ -0,0 +1,122 @@
+from collections import OrderedDict
+
+import cv2
+
+from smoothing import smooth
+
+
+class PreprocessingContext(object):
+    """
+    Memoizes the preprocessing steps of an image, so that every detector working on the image shares them
+    """
+
+    def __init__(self, image, max_bytes=256 * 1024 * 1024):
+        """
+        Initialize the context with an image
+
+        :type image: numpy.ndarray
+        :param image: BGR image to be preprocessed
+        :type max_bytes: int
+        :param max_bytes: Optional size limit of the memoized images. When exceeded,
+            the least recently used images are dropped
+        """
+
+        self.image = image
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key, compute):
+        """
+        Get a memoized image, computing it if needed
+
+        The image is made read-only, since every detector is given the same image
+
+        :type key: tuple
+        :param key: Name of the operation followed by its parameters
+        :type compute: () -> numpy.ndarray
+        :param compute: Function computing the image
+        :rtype: numpy.ndarray
+        :return: The read-only image
+        """
+
+        if key in self._cache:
+            # Move the image to the most recently used end
+            result = self._cache.pop(key)
+            self._cache[key] = result
+            return result
+
+        result = compute()
+        result.flags.writeable = False
+        self._cache[key] = result
+        self._bytes += result.nbytes
+
+        # Drop the least recently used images, but always keep the one just computed
+        while self._bytes > self.max_bytes and len(self._cache) > 1:
+            dropped_key, dropped = self._cache.popitem(last=False)
+            self._bytes -= dropped.nbytes
+        return result
+
+    def clear(self):
+        """
+        Drop every memoized image
+        """
+
+        self._cache.clear()
+        self._bytes = 0
+
+    def gray(self):
+        """
+        :rtype: numpy.ndarray
+        :return: Grayscale version of the image
+        """
+
+        return self.get(('gray',), lambda: cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY))
+
+    def smooth(self, kernel_size, sigma, backend='bilateral'):
+        """
+        :type kernel_size: (int, int)
+        :param kernel_size: Kernel size of the filter
+        :type sigma: float
+        :param sigma: Sigma space of the filter
+        :type backend: str
+        :param backend: Optional name of the smoothing backend, one of utils.smoothing.smoothing_backends
+        :rtype: numpy.ndarray
+        :return: Grayscale version of the image, blurred by the backend
+        """
+
+        return self.get(('smooth', backend, kernel_size, sigma),
+                        lambda: smooth(self.gray(), kernel_size, sigma, backend))
+
+    def bilateral(self, kernel_size, sigma):
+        """
+        :type kernel_size: (int, int)
+        :param kernel_size: Kernel size of the filter
+        :type sigma: float
+        :param sigma: Sigma space of the filter
+        :rtype: numpy.ndarray
+        :return: Grayscale version of the image, blurred by an adaptive bilateral filter
+        """
+
+        return self.smooth(kernel_size, sigma, 'bilateral')
+
+    def adaptive_threshold(self, kernel_size, sigma, block_size, c, smoothing='bilateral'):
+        """
+        :type kernel_size: (int, int)
+        :param kernel_size: Kernel size of the smoothing filter
+        :type sigma: float
+        :param sigma: Sigma space of the smoothing filter
+        :type block_size: int
+        :param block_size: Size of the neighbourhood used to calculate the threshold
+        :type c: float
+        :param c: Constant subtracted from the weighted mean of the neighbourhood
+        :type smoothing: str
+        :param smoothing: Optional name of the smoothing backend, one of utils.smoothing.smoothing_backends
+        :rtype: numpy.ndarray
+        :return: Inverted gaussian adaptive threshold of the blurred version of the image
+        """
+
+        return self.get(('adaptive_threshold', smoothing, kernel_size, sigma, block_size, c),
+                        lambda: cv2.adaptiveThreshold(self.smooth(kernel_size, sigma, smoothing), 255,
+                                                      cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV,
+                                                      block_size, c))
@@ -0,0 +1,135 @@
+import cv2
+import numpy as np
+
+
+def bilateral(gray, kernel_size, sigma):
+    """
+    Edge-preserving blur weighing the neighbours by their distance and their difference in intensity
+
+    The adaptive bilateral filter was removed in OpenCV 3, where the plain bilateral filter is used instead
+
+    :type gray: numpy.ndarray
+    :param gray: Grayscale image
+    :type kernel_size: (int, int)
+    :param kernel_size: Kernel size of the filter
+    :type sigma: float
+    :param sigma: Sigma space of the filter
+    :rtype: numpy.ndarray
+    :return: The blurred image
+    """
+
+    if hasattr(cv2, 'adaptiveBilateralFilter'):
+        return cv2.adaptiveBilateralFilter(gray, kernel_size, sigma)
+
+    # 20 is the default maximum sigma color of the adaptive filter
+    return cv2.bilateralFilter(gray, max(kernel_size), 20, sigma)
+
+
+def guided(gray, kernel_size, sigma, eps=20 ** 2):
+    """
+    Edge-preserving blur using the image as its own guide, made of box filters only
+
+    :type gray: numpy.ndarray
+    :param gray: Grayscale image
+    :type kernel_size: (int, int)
+    :param kernel_size: Kernel size of the box filters
+    :type sigma: float
+    :param sigma: Unused, the box filters have no spatial weights
+    :type eps: float
+    :param eps: Optional regularization, variances well below it are smoothed and well above it are kept
+    :rtype: numpy.ndarray
+    :return: The blurred image
+    """
+
+    img = gray.astype(np.float32)
+    mean = cv2.blur(img, kernel_size)
+    variance = cv2.blur(img * img, kernel_size) - mean * mean
+
+    # Linear coefficients of every window, averaged over the windows covering each pixel
+    a = variance / (variance + eps)
+    b = mean - a * mean
+    result = cv2.blur(a, kernel_size) * img + cv2.blur(b, kernel_size)
+    return np.clip(result + 0.5, 0, 255).astype(np.uint8)
+
+
+def gaussian(gray, kernel_size, sigma):
+    """
+    Separable gaussian blur, with a sigma derived from the kernel size
+
+    :type gray: numpy.ndarray
+    :param gray: Grayscale image
+    :type kernel_size: (int, int)
+    :param kernel_size: Kernel size of the filter, both odd
+    :type sigma: float
+    :param sigma: Unused, the sigma spaces of the bilateral filters spread the gaussian well beyond the kernel
+    :rtype: numpy.ndarray
+    :return: The blurred image
+    """
+
+    return cv2.GaussianBlur(gray, kernel_size, 0)
+
+
+def box(gray, kernel_size, sigma):
+    """
+    Mean of the neighbourhood of every pixel
+
+    :type gray: numpy.ndarray
+    :param gray: Grayscale image
+    :type kernel_size: (int, int)
+    :param kernel_size: Kernel size of the filter
+    :type sigma: float
+    :param sigma: Unused
+    :rtype: numpy.ndarray
+    :return: The blurred image
+    """
+
+    return cv2.blur(gray, kernel_size)
+
+
+def median(gray, kernel_size, sigma):
+    """
+    Median of the square neighbourhood of every pixel, preserving edges
+
+    :type gray: numpy.ndarray
+    :param gray: Grayscale image
+    :type kernel_size: (int, int)
+    :param kernel_size: Kernel size of the filter, the bigger side is used
+    :type sigma: float
+    :param sigma: Unused
+    :rtype: numpy.ndarray
+    :return: The blurred image
+    """
+
+    return cv2.medianBlur(gray, max(kernel_size) | 1)
+
+
+# Smoothing functions by name, all taking a grayscale image, a kernel size and a sigma space
+smoothing_backends = {
+    'bilateral': bilateral,
+    'guided': guided,
+    'gaussian': gaussian,
+    'box': box,
+    'median': median
+}
+
+
+def smooth(gray, kernel_size, sigma, backend='bilateral'):
+    """
+    Blur a grayscale image with one of the smoothing backends
+
+    :type gray: numpy.ndarray
+    :param gray: Grayscale image
+    :type kernel_size: (int, int)
+    :param kernel_size: Kernel size of the filter
+    :type sigma: float
+    :param sigma: Sigma space of the filter, used by the bilateral backend only
+    :type backend: str
+    :param backend: Optional name of the backend, one of smoothing_backends
+    :rtype: numpy.ndarray
+    :return: The blurred image
+    """
+
+    if backend not in smoothing_backends:
+        raise ValueError("Unknown smoothing backend '%s', expected one of: %s"
+                         % (backend, ", ".join(sorted(smoothing_backends))))
+    return smoothing_backends[backend](gray, kernel_size, sigma)
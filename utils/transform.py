@@ -1,7 +1,7 @@
 import cv2
 import numpy as np
 import math
-from utils import display, image
+from utils import display, image, visualization
 
 
 def deskew_lines(plate):
@@ -14,18 +14,32 @@ def deskew_lines(plate):
     :return: Gray image of the deskewed license plate
     """
 
+    return warp_plate(plate, lines_transform(plate), 'Deskew lines rotated')
+
+
+def lines_transform(plate):
+    """
+    Find the skew of the image from the average angle of the lines in the image
+
+    :type plate: numpy.array
+    :param plate: Gray image of the license plate
+    :rtype: numpy.array | None
+    :return: 2x3 affine matrix transforming the image to the deskewed image, None when no lines are found
+    """
+
     if __debug__:
         print("Deskewing lines")
 
     angle_rad = 0.0
 
-    img = plate.copy()
-    # The below copy is used only to visualize the process
-    disp_img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    img = plate
     height, width = img.shape
 
-    if __debug__:
-        display.show_image(disp_img, resize=False)
+    # The below copy is used only to visualize the process, when a sink is attached
+    sink = visualization.get_sink()
+    disp_img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR) if sink is not None else None
+    if sink is not None:
+        sink.show(disp_img, 'Deskew lines')
 
     # Detect lines in the image
     lines = cv2.HoughLinesP(img, 1, np.pi / 180, 100, minLineLength=3 * width / 4, maxLineGap=20)
@@ -37,7 +51,8 @@ def deskew_lines(plate):
             x1, y1, x2, y2 = line[0], line[1], line[2], line[3]
 
             # Draw the line (for visualization only)
-            cv2.line(disp_img, (x1, y1), (x2, y2), color=(0, 255, 0), thickness=1)
+            if sink is not None:
+                cv2.line(disp_img, (x1, y1), (x2, y2), color=(0, 255, 0), thickness=1)
 
             line_angle = math.atan2(y2 - y1, x2 - x1)
             angle_rad += line_angle
@@ -47,15 +62,11 @@ def deskew_lines(plate):
         angle = math.degrees(angle_rad)
         # print "Avg angle deg: %.3f\n" % angle
 
-        if __debug__:
-            display.show_image(disp_img, resize=False)
+        if sink is not None:
+            sink.show(disp_img, 'Deskew lines found')
 
-        rotation_mat = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1)
-        img = cv2.warpAffine(img, rotation_mat, (width, height))
-        disp_img = cv2.warpAffine(disp_img, rotation_mat, (width, height))
-        if __debug__:
-            display.show_image(disp_img, resize=False)
-    return img
+        return cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1)
+    return None
 
 
 def deskew_text(plate):
@@ -68,12 +79,26 @@ def deskew_text(plate):
     :return: Gray image of the deskewed license plate
     """
 
+    return warp_plate(plate, text_transform(plate), 'Deskew text')
+
+
+def text_transform(plate):
+    """
+    Find the skew of the image from the corners of a bounding rectangle around the contours of the characters
+
+    :type plate: numpy.ndarray
+    :param plate: Gray image of the license plate
+    :rtype: numpy.array | None
+    :return: 3x3 perspective matrix transforming the image to the deskewed image, None when no characters are found
+    """
+
     if __debug__:
         print("Deskewing text")
 
-    img = plate.copy()
-    # The below copy is used only to visualize the process
-    disp_img = cv2.cvtColor(plate, cv2.COLOR_GRAY2BGR)
+    img = plate
+    # The below copy is used only to visualize the process, when a sink is attached
+    sink = visualization.get_sink()
+    disp_img = cv2.cvtColor(plate, cv2.COLOR_GRAY2BGR) if sink is not None else None
 
     img_height, img_width = img.shape
     img_area = img_height * img_width
@@ -111,13 +136,14 @@ def deskew_text(plate):
                     print("Passed\n")
 
                 # Draw the box contours (for visualization only)
-                cv2.drawContours(disp_img, [box], 0, (0, 255, 0), 1)
+                if sink is not None:
+                    cv2.drawContours(disp_img, [box], 0, (0, 255, 0), 1)
 
                 boxes.append(box_points)
                 for (x, y) in box_points:
                     points.add((x, y))
                     point_to_rect[(x, y)] = (mr, ct)
-            else:
+            elif sink is not None:
                 cv2.drawContours(disp_img, [box], 0, (0, 0, 255), 1)
 
     # Sort points ascending by their x-coordinate and descending by their y-coordinate
@@ -174,7 +200,8 @@ def deskew_text(plate):
                 top_right = (x + box_width, y)
 
                 # Draw the non-rotated bounding rectangle (for visualization only)
-                cv2.rectangle(disp_img, (x, y), (x + box_width, y + box_height), (255, 255, 0), 1)
+                if sink is not None:
+                    cv2.rectangle(disp_img, (x, y), (x + box_width, y + box_height), (255, 255, 0), 1)
 
             # The leftmost rectangle has an angle of rotation bigger than 10
             elif diff > 10 and a2 < a1:
@@ -185,7 +212,8 @@ def deskew_text(plate):
                 top_left = (x, y)
 
                 # Draw the non-rotated bounding rectangle (for visualization only)
-                cv2.rectangle(disp_img, (x, y), (x + box_width, y + box_height), (255, 255, 0), 1)
+                if sink is not None:
+                    cv2.rectangle(disp_img, (x, y), (x + box_width, y + box_height), (255, 255, 0), 1)
 
         # Add border margin to each coordinate to have a space of few pixels away from the edge
         border_margin = 3
@@ -201,9 +229,6 @@ def deskew_text(plate):
         # Get a transformation matrix based on our source and destination points
         trans_matrix = cv2.getPerspectiveTransform(corners, dest_points)
 
-        # Apply perspective transformation
-        disp_wrapped = cv2.warpPerspective(img, trans_matrix, (img_width, img_height))
-
         # Relationship between the new coordinates and the old
         # xn = ((trans_matrix[0][0]*x+trans_matrix[0][1]*y+trans_matrix[0][2]) /
         # (trans_matrix[2][0]*x+trans_matrix[2][1]*y+trans_matrix[2][2]))
@@ -211,14 +236,287 @@ def deskew_text(plate):
         # (trans_matrix[2][0]*x+trans_matrix[2][1]*y+trans_matrix[2][2]))
 
         # Draw the corner points (for visualization only)
-        cv2.circle(disp_img, bottom_left, 1, (255, 0, 0), thickness=2)
-        cv2.circle(disp_img, top_left, 1, (255, 0, 0), thickness=2)
-        cv2.circle(disp_img, bottom_right, 1, (255, 0, 0), thickness=2)
-        cv2.circle(disp_img, top_right, 1, (255, 0, 0), thickness=2)
+        if sink is not None:
+            for corner in (bottom_left, top_left, bottom_right, top_right):
+                cv2.circle(disp_img, corner, 1, (255, 0, 0), thickness=2)
+            sink.show(disp_img, 'Deskew text corners')
+        return trans_matrix
+
+    return None
+
 
-        if __debug__:
-            display.show_image(disp_img, resize=False)
-            display.show_image(disp_wrapped, resize=False)
-        return disp_wrapped
+def deskew_moments(plate):
+    """
+    Remove image skew by rotating the principal axis of the image moments to the horizontal
+
+    :type plate: numpy.array
+    :param plate: Gray image of the license plate
+    :rtype: numpy.array
+    :return: Gray image of the deskewed license plate
+    """
+
+    return warp_plate(plate, moments_transform(plate), 'Deskew moments')
+
+
+def moments_transform(plate):
+    """
+    Find the rotation of the image from the principal axis of its moments
+
+    :type plate: numpy.array
+    :param plate: Gray image of the license plate
+    :rtype: numpy.array | None
+    :return: 2x3 affine matrix transforming the image to the deskewed image, None for an empty image
+    """
+
+    moments = cv2.moments(plate, binaryImage=True)
+    if moments['m00'] == 0:
+        return None
+
+    # Orientation of the axis along which the white pixels spread the most
+    angle_rad = 0.5 * math.atan2(2 * moments['mu11'], moments['mu20'] - moments['mu02'])
+    return _skew_matrix(plate.shape, math.degrees(angle_rad), 0.0)
+
+
+def deskew_profile(plate, max_angle=30.0, max_shear=25.0):
+    """
+    Remove image rotation and shear by searching for the angles giving the sharpest projection profiles
+
+    The rotation makes the rows of the text the sharpest, then the shear makes the columns of the characters
+    the sharpest. Both are searched coarsely, then refined around the best angle
+
+    :type plate: numpy.array
+    :param plate: Gray image of the license plate
+    :type max_angle: float
+    :param max_angle: Optional biggest rotation in degrees to search for
+    :type max_shear: float
+    :param max_shear: Optional biggest slant of the characters in degrees to search for
+    :rtype: numpy.array
+    :return: Gray image of the deskewed license plate
+    """
+
+    return warp_plate(plate, profile_transform(plate, max_angle, max_shear), 'Deskew profile')
+
+
+def profile_transform(plate, max_angle=30.0, max_shear=25.0):
+    """
+    Find the rotation and the shear of the image giving the sharpest projection profiles
+
+    :type plate: numpy.array
+    :param plate: Gray image of the license plate
+    :type max_angle: float
+    :param max_angle: Optional biggest rotation in degrees to search for
+    :type max_shear: float
+    :param max_shear: Optional biggest slant of the characters in degrees to search for
+    :rtype: numpy.array | None
+    :return: 2x3 affine matrix transforming the image to the deskewed image, None for an empty image
+    """
 
+    points = np.argwhere(plate > 0)
+    if len(points) == 0:
+        return None
+
+    # A couple of thousand points describe the profiles well enough
+    if len(points) > 2048:
+        points = points[np.random.RandomState(0).choice(len(points), 2048, replace=False)]
+
+    # Spread every point over its pixel, otherwise the pixel grid makes the unrotated profiles the sharpest
+    points = points + np.random.RandomState(1).uniform(-0.5, 0.5, points.shape)
+    y, x = points[:, 0], points[:, 1]
+
+    def rotation_score(angles):
+        radians = np.radians(angles)[:, np.newaxis]
+        return _profile_sharpness(y * np.cos(radians) - x * np.sin(radians))
+
+    angle = _search_angle(rotation_score, max_angle)
+
+    # Slant of the characters once the rows are horizontal
+    radians = math.radians(angle)
+    rotated_x = x * math.cos(radians) + y * math.sin(radians)
+    rotated_y = y * math.cos(radians) - x * math.sin(radians)
+
+    def shear_score(angles):
+        return _profile_sharpness(rotated_x - np.tan(np.radians(angles))[:, np.newaxis] * rotated_y)
+
+    shear = _search_angle(shear_score, max_shear)
+    return _skew_matrix(plate.shape, angle, math.tan(math.radians(shear)))
+
+
+def _search_angle(score, max_angle, coarse_step=1.0, fine_step=0.1):
+    """
+    Find the angle with the best score, first in coarse steps and then in fine steps around the best coarse one
+
+    :type score: (numpy.array) -> numpy.array
+    :param score: Function scoring an array of angles in degrees
+    :rtype: float
+    :return: The best angle in degrees
+    """
+
+    angles = np.arange(-max_angle, max_angle + coarse_step / 2, coarse_step)
+    best = angles[np.argmax(score(angles))]
+    angles = best + np.arange(-coarse_step, coarse_step + fine_step / 2, fine_step)
+    return float(angles[np.argmax(score(angles))])
+
+
+def _profile_sharpness(coordinates):
+    """
+    Score projection profiles by the sum of their squared bin counts, higher when the points gather in fewer bins
+
+    :type coordinates: numpy.array
+    :param coordinates: (A, N) array of the projected coordinates of N points for A angles
+    :rtype: numpy.array
+    :return: Score of every angle
+    """
+
+    bins = np.floor(coordinates - coordinates.min(axis=1)[:, np.newaxis]).astype(np.intp)
+    bin_count = bins.max() + 1
+
+    # Count all profiles at once by giving every angle its own range of bins
+    counts = np.bincount((bins + np.arange(len(bins))[:, np.newaxis] * bin_count).ravel(),
+                         minlength=len(bins) * bin_count).reshape(len(bins), bin_count)
+    return (counts.astype(np.float64) ** 2).sum(axis=1)
+
+
+def _skew_matrix(shape, angle, shear):
+    """
+    Rotate and shear an image around its center with a single affine transformation
+
+    :type shape: (int, int)
+    :param shape: Height and width of the image
+    :type angle: float
+    :param angle: Rotation of the text rows in degrees
+    :type shear: float
+    :param shear: Horizontal shift per row of the rotated characters
+    :rtype: numpy.array
+    :return: 2x3 affine matrix of the transformation
+    """
+
+    height, width = shape[:2]
+    center = (width / 2.0, height / 2.0)
+
+    rotation_mat = np.vstack((cv2.getRotationMatrix2D(center, angle, 1), [0, 0, 1]))
+    shear_mat = np.array([[1, -shear, shear * center[1]], [0, 1, 0], [0, 0, 1]], np.float64)
+    return shear_mat.dot(rotation_mat)[:2]
+
+
+def warp_plate(plate, matrix, title='Deskew'):
+    """
+    Apply a deskewing transformation to the image, keeping its size
+
+    :type plate: numpy.array
+    :param plate: Gray image of the license plate
+    :type matrix: numpy.array | None
+    :param matrix: 2x3 affine or 3x3 perspective matrix of the transformation, None to leave the image as it is
+    :type title: str
+    :param title: Optional title of the visualization
+    :rtype: numpy.array
+    :return: Gray image of the deskewed license plate
+    """
+
+    if matrix is None:
+        return plate.copy()
+
+    height, width = plate.shape
+    if matrix.shape[0] == 2:
+        img = cv2.warpAffine(plate, matrix, (width, height))
+    else:
+        img = cv2.warpPerspective(plate, matrix, (width, height))
+
+    sink = visualization.get_sink()
+    if sink is not None:
+        sink.show(img, title)
+    return img
+
+
+def crop_plates(frame, rectangles):
+    """
+    Crop the upright bounding boxes of the plate rectangles from the frame and binarize them, without zooming them,
+    so that deskew_frame can find their skew
+
+    :type frame: numpy.array
+    :param frame: Gray image the plates were detected in
+    :type rectangles: list[numpy.array]
+    :param rectangles: Rectangles of the plates, as returned by the find_rectangles method of the detectors
+    :rtype: list[(numpy.array, numpy.array)]
+    :return: List of tuples containing the plate image and the plate rectangle location.
+        The plates are binarized with Otsu's threshold, with black background and white characters
+    """
+
+    ret = []
+    for plate, rectangle in zip(display.get_parts_of_image(frame, rectangles), rectangles):
+        if plate.size == 0:
+            continue
+
+        plate = cv2.bitwise_not(plate)
+        a, plate = cv2.threshold(plate, 50, 255, cv2.THRESH_OTSU)
+        ret.append((plate, rectangle))
+    return ret
+
+
+def deskew_frame(frame, plate, rectangle, method='text', scale=1.0):
+    """
+    Remove the skew of a plate by sampling it from the frame it was detected in, with a single transformation
+    composed of the crop, the deskewing and the scaling, instead of resampling the cropped plate again
+
+    :type frame: numpy.array
+    :param frame: Gray image the plate was detected in
+    :type plate: numpy.array
+    :param plate: Gray image of the license plate, as returned by the detector or crop_plates.
+        Used to find the skew only
+    :type rectangle: numpy.array
+    :param rectangle: Rectangle the plate was cropped from
+    :type method: str
+    :param method: Optional name of the deskewing method, one of skew_transforms
+    :type scale: float
+    :param scale: Optional scale of the deskewed plate relative to the plate returned by the detector
+    :rtype: numpy.array | None
+    :return: Gray image of the deskewed license plate, binarized with Otsu's threshold like crop_plates does,
+        with black background and white characters. None when the plate is not a crop of the upright bounding box
+        of the rectangle
+    """
+
+    crop = display.crop_transform(rectangle, plate.shape, frame.shape)
+    if crop is None:
+        return None
+
+    skew = skew_transforms[method](plate)
+    if skew is None:
+        skew = np.eye(3)
+    affine = skew.shape[0] == 2
+    if affine:
+        skew = np.vstack((skew, [0, 0, 1]))
+
+    plate_height, plate_width = plate.shape[:2]
+    size = (int(round(plate_width * scale)), int(round(plate_height * scale)))
+    zoom = np.array([[scale, 0, 0.5 * scale - 0.5], [0, scale, 0.5 * scale - 0.5], [0, 0, 1]], np.float64)
+    matrix = zoom.dot(skew).dot(crop)
+
+    # Outside of the frame is white, which becomes black background once inverted
+    if affine:
+        img = cv2.warpAffine(frame, matrix[:2], size, borderValue=255)
+    else:
+        img = cv2.warpPerspective(frame, matrix, size, borderValue=255)
+
+    img = cv2.bitwise_not(img)
+    a, img = cv2.threshold(img, 50, 255, cv2.THRESH_OTSU)
+
+    sink = visualization.get_sink()
+    if sink is not None:
+        sink.show(img, 'Deskew frame')
     return img
+
+
+# Deskewing functions by name, all taking a gray image of a license plate
+deskew_methods = {
+    'text': deskew_text,
+    'lines': deskew_lines,
+    'moments': deskew_moments,
+    'profile': deskew_profile
+}
+
+# Functions finding the deskewing transformation of a gray image of a license plate, by the name of the method
+skew_transforms = {
+    'text': text_transform,
+    'lines': lines_transform,
+    'moments': moments_transform,
+    'profile': profile_transform
+}
@@ -0,0 +1,107 @@
+import os
+import time
+
+import cv2
+import loader
+
+
+def _capture_property(name):
+    """
+    Get the identifier of a capture property, named CAP_PROP_* since OpenCV 3 and cv.CV_CAP_PROP_* before
+    """
+
+    if hasattr(cv2, 'CAP_PROP_' + name):
+        return getattr(cv2, 'CAP_PROP_' + name)
+    return getattr(cv2.cv, 'CV_CAP_PROP_' + name)
+
+
+class VideoSource(object):
+    """
+    Lazily reads the frames of a video file or stream, usable in place of utils.loader.iter_images
+    """
+
+    def __init__(self, source, stride=1, skip=0, queue_size=2, realtime=False):
+        """
+        Initialize the source with a video
+
+        :type source: str | int
+        :param source: Path of a video file, URL of a stream or index of a camera
+        :type stride: int
+        :param stride: Optional number of frames per frame kept, the others are not decoded
+        :type skip: int
+        :param skip: Optional number of frames skipped at the start of the video
+        :type queue_size: int
+        :param queue_size: Optional number of frames read ahead on a background thread
+        :type realtime: bool
+        :param realtime: Optional flag to keep up with the source instead of waiting for the consumer.
+            When the queue is full the oldest frame is dropped for the new one. Video files are read
+            at their frame rate, like a stream
+        """
+
+        self.source = source
+        self.stride = max(1, stride)
+        self.skip = max(0, skip)
+        self.queue_size = max(1, queue_size)
+        self.realtime = realtime
+
+        # Number of frames yielded and dropped by the last iteration
+        self.frames_read = 0
+        self.frames_dropped = 0
+
+    def __iter__(self):
+        """
+        :rtype: collections.Iterable[(str, numpy.array)]
+        :return: A label made of the source and the frame number, and the frame, for every kept frame in order
+        :raises: IOError if the source cannot be opened
+        """
+
+        capture = cv2.VideoCapture(self.source)
+        if not capture.isOpened():
+            raise IOError("Cannot open the video source: %s" % self.source)
+
+        # A video file is read as fast as it can be decoded, unless it is paced at its frame rate
+        frame_interval = 0.0
+        if self.realtime and isinstance(self.source, str) and os.path.isfile(self.source):
+            fps = capture.get(_capture_property('FPS'))
+            frame_interval = 1.0 / fps if fps > 0 else 0.0
+
+        self.frames_read = 0
+        self.frames_dropped = 0
+
+        def read():
+            try:
+                index = 0
+                next_time = time.time()
+                while True:
+                    if frame_interval > 0:
+                        delay = next_time - time.time()
+                        if delay > 0:
+                            time.sleep(delay)
+                        next_time += frame_interval
+
+                    keep = index >= self.skip and (index - self.skip) % self.stride == 0
+                    if keep:
+                        ok, frame = capture.read()
+                    else:
+                        # Skipped frames are only grabbed, without decoding them into an image
+                        ok, frame = capture.grab(), None
+                    if not ok:
+                        break
+
+                    if keep:
+                        yield "%s#%d" % (self.source, index), frame
+                    index += 1
+            finally:
+                capture.release()
+
+        def drop(item):
+            self.frames_dropped += 1
+
+        # In realtime mode the oldest frame is dropped for the new one when the consumer is behind
+        frames = loader.iter_prefetched(read(), self.queue_size, self.realtime, drop, "video-reader")
+        try:
+            for item in frames:
+                self.frames_read += 1
+                yield item
+        finally:
+            frames.close()
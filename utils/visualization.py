@@ -0,0 +1,80 @@
+import itertools
+import os
+import re
+
+import cv2
+
+import display
+
+
+class WindowSink(object):
+    """
+    Shows every visualization in a window and waits for a key
+    """
+
+    def show(self, image, title='image'):
+        """
+        :type image: numpy.array
+        :param image: Visualization to be shown
+        :type title: str
+        :param title: Optional title for the window
+        """
+
+        display.show_image(image, image_title=title, resize=False)
+
+
+class TraceSink(object):
+    """
+    Writes every visualization to an image file, numbered in the order they were made
+    """
+
+    def __init__(self, directory, extension='.png'):
+        """
+        :type directory: str
+        :param directory: Directory of the image files, created if missing
+        :type extension: str
+        :param extension: Optional extension of the image files, telling their format
+        """
+
+        self.directory = directory
+        self.extension = extension
+        self._counter = itertools.count()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def show(self, image, title='image'):
+        """
+        :type image: numpy.array
+        :param image: Visualization to be written
+        :type title: str
+        :param title: Optional title, used in the file name
+        """
+
+        # The process id keeps the files of the workers of a batch apart
+        name = "%d-%05d-%s%s" % (os.getpid(), next(self._counter), re.sub(r'\W+', '_', title), self.extension)
+        cv2.imwrite(os.path.join(self.directory, name), image)
+
+
+# Sink of the visualizations of the processing steps. Debug runs show them in windows, optimized runs skip them
+_sink = WindowSink() if __debug__ else None
+
+
+def get_sink():
+    """
+    :rtype: WindowSink | TraceSink | None
+    :return: The sink the visualizations are sent to, None when they are not made at all
+    """
+
+    return _sink
+
+
+def set_sink(sink):
+    """
+    Send the visualizations of the processing steps to another sink
+
+    :type sink: WindowSink | TraceSink | None
+    :param sink: Object with a show(image, title) method, or None to stop making the visualizations
+    """
+
+    global _sink
+    _sink = sink